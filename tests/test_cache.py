@@ -0,0 +1,44 @@
+"""Tests for the cache module."""
+
+from workknow import cache
+from workknow import constants
+
+
+def test_store_and_load_response_details_round_trip(tmp_path):
+    """Check that stored response details can be loaded back out of the cache."""
+    # create the name of a cache file inside of a temporary directory so
+    # that the test does not interact with any real on-disk cache state
+    cache_file_name = cache.create_cache_file_name(tmp_path)
+    url_key = "https://api.github.com/repos/org/repo/actions/runs?page=1"
+    etag = 'W/"0123456789abcdef"'
+    workflow_runs = [{"id": 1, "name": "build"}, {"id": 2, "name": "lint"}]
+    links = {"next": {"url": url_key + "&page=2"}}
+    # store a complete record for the URL and then confirm that both the
+    # ETag and the response details load back exactly as they were stored
+    cache.store_response_details(cache_file_name, url_key, etag, workflow_runs, links)
+    assert cache.load_etag(cache_file_name, url_key) == etag
+    loaded_workflow_runs, loaded_links = cache.load_response_details(
+        cache_file_name, url_key
+    )
+    assert loaded_workflow_runs == workflow_runs
+    assert loaded_links == links
+
+
+def test_load_etag_returns_empty_marker_for_unknown_url(tmp_path):
+    """Check that a URL without a cached record produces the empty marker."""
+    cache_file_name = cache.create_cache_file_name(tmp_path)
+    url_key = "https://api.github.com/repos/org/repo/actions/runs?page=1"
+    assert cache.load_etag(cache_file_name, url_key) == constants.markers.Nothing
+
+
+def test_store_response_details_skips_record_without_etag(tmp_path):
+    """Check that no record is stored when the response did not provide an ETag."""
+    cache_file_name = cache.create_cache_file_name(tmp_path)
+    url_key = "https://api.github.com/repos/org/repo/actions/runs?page=1"
+    # attempt to store a record with the empty ETag marker; since the GitHub
+    # API did not provide an ETag there is nothing usable to store and a
+    # later lookup of the same URL must still produce the empty marker
+    cache.store_response_details(
+        cache_file_name, url_key, constants.markers.Nothing, [], {}
+    )
+    assert cache.load_etag(cache_file_name, url_key) == constants.markers.Nothing
@@ -0,0 +1,32 @@
+"""Tests for the produce module."""
+
+from workknow import produce
+
+
+def test_flatten_nested_dictionary_joins_keys_with_underscore():
+    """Check that nested dictionaries flatten with underscore-joined key names."""
+    # use a dictionary shaped like the head_commit data from the GitHub API,
+    # with plain values at the top level and a nested author dictionary
+    nested_dictionary = {
+        "id": "abc123",
+        "author": {"name": "A Person", "email": "person@example.com"},
+    }
+    flat_dictionary = {}  # type: ignore
+    produce.flatten_nested_dictionary(nested_dictionary, flat_dictionary, "head_commit")
+    # every value must appear under a key that joins the parent key onto
+    # the chain of nested keys with an underscore between each of the names
+    assert flat_dictionary == {
+        "head_commit_id": "abc123",
+        "head_commit_author_name": "A Person",
+        "head_commit_author_email": "person@example.com",
+    }
+
+
+def test_flatten_nested_dictionary_without_parent_key():
+    """Check that flattening with no parent key keeps the top-level key names."""
+    # use a dictionary with two levels of nesting to confirm that the
+    # recursion joins every level of the nested key names together
+    nested_dictionary = {"outer": {"middle": {"inner": 1}}, "plain": 2}
+    flat_dictionary = {}  # type: ignore
+    produce.flatten_nested_dictionary(nested_dictionary, flat_dictionary, "")
+    assert flat_dictionary == {"outer_middle_inner": 1, "plain": 2}
@@ -121,7 +121,10 @@ def test_request_exception_backoff_retry_mocked_HTTPError():
         assert valid is False
         assert response is None
         assert total_retry_count == 2
-        assert total_retry_time == (1 + 2)
+        # the back-off sleeps are jittered draws below the exponential
+        # ceilings and thus the total sleep time is bounded by the sum of
+        # the ceilings instead of matching it exactly
+        assert 0 <= total_retry_time <= (1 + 2)
 
 
 @responses.activate
@@ -176,7 +179,10 @@ def test_request_exception_backoff_retry_mocked_ChunkedEcodingError():
         assert valid is False
         assert response is None
         assert total_retry_count == 2
-        assert total_retry_time == (1 + 2)
+        # the back-off sleeps are jittered draws below the exponential
+        # ceilings and thus the total sleep time is bounded by the sum of
+        # the ceilings instead of matching it exactly
+        assert 0 <= total_retry_time <= (1 + 2)
 
 
 @responses.activate
@@ -240,7 +246,10 @@ def test_failure_backoff_one_retry_mocked():
     assert valid is False
     assert json_responses_list == []
     assert total_retry_count == 1
-    assert total_retry_time == 1
+    # the back-off sleeps are jittered draws below the exponential
+    # ceilings and thus the total sleep time is bounded by the sum of
+    # the ceilings instead of matching it exactly
+    assert 0 <= total_retry_time <= 1
 
 
 @responses.activate
@@ -272,4 +281,7 @@ def test_failure_backoff_three_retries_mocked():
     assert valid is False
     assert json_responses_list == []
     assert total_retry_count == 3
-    assert total_retry_time == (1 + 2 + 4)
+    # the back-off sleeps are jittered draws below the exponential
+    # ceilings and thus the total sleep time is bounded by the sum of
+    # the ceilings instead of matching it exactly
+    assert 0 <= total_retry_time <= (1 + 2 + 4)
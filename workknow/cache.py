@@ -0,0 +1,76 @@
+"""Cache responses from the GitHub API on disk using their ETag values."""
+
+import logging
+import shelve
+
+from pathlib import Path
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from workknow import constants
+
+# The GitHub API returns an ETag header with every response and supports
+# conditional requests through the If-None-Match header. When the data for
+# a URL has not changed since the previous download, the API answers with
+# a 304 Not Modified response that contains no body and, importantly, does
+# not count against the primary rate limit. Storing the ETag value and the
+# associated workflow runs on disk thus makes incremental re-runs of
+# WorkKnow consume almost none of the rate limit for unchanged repositories.
+#
+# Reference:
+# https://docs.github.com/en/rest/overview/resources-in-the-rest-api#conditional-requests
+
+
+def create_cache_file_name(cache_dir: Path) -> str:
+    """Create the textual name of the cache file inside of the cache directory."""
+    cache_file_path = cache_dir / constants.filesystem.Etag_Cache
+    return str(cache_file_path.resolve())
+
+
+def load_etag(cache_file_name: str, url_key: str) -> str:
+    """Load the previously stored ETag value for a URL, if one exists."""
+    logger = logging.getLogger(constants.logging.Rich)
+    with shelve.open(cache_file_name) as cache_store:
+        # the URL was previously cached and thus its ETag can be extracted
+        if url_key in cache_store:
+            cached_record = cache_store[url_key]
+            etag = cached_record[constants.cache.Etag]
+            logger.debug(f"Found cached ETag {etag} for {url_key}")
+            return etag
+    # there is no cached record for this URL so return the empty marker
+    return constants.markers.Nothing
+
+
+def load_response_details(
+    cache_file_name: str, url_key: str
+) -> Tuple[List[Dict[Any, Any]], Dict[str, Dict[str, str]]]:
+    """Load the previously stored workflow runs and links for a URL."""
+    with shelve.open(cache_file_name) as cache_store:
+        cached_record = cache_store[url_key]
+        return (
+            cached_record[constants.cache.Workflow_Runs],
+            cached_record[constants.cache.Links],
+        )
+
+
+def store_response_details(
+    cache_file_name: str,
+    url_key: str,
+    etag: str,
+    workflow_runs: List[Dict[Any, Any]],
+    links: Dict[str, Dict[str, str]],
+) -> None:
+    """Store the ETag, workflow runs, and links for a URL inside of the cache."""
+    logger = logging.getLogger(constants.logging.Rich)
+    # only store a record when the GitHub API actually provided an ETag value
+    if etag != constants.markers.Nothing:
+        with shelve.open(cache_file_name) as cache_store:
+            cache_store[url_key] = {
+                constants.cache.Etag: etag,
+                constants.cache.Workflow_Runs: workflow_runs,
+                constants.cache.Links: dict(links),
+            }
+        logger.debug(f"Stored cached response with ETag {etag} for {url_key}")
@@ -144,6 +144,14 @@ def extract_data(workflows_data_frame: pandas.DataFrame, attribute: str) -> str:
 
 def combine_data_frames(data_frame_list: List[pandas.DataFrame]) -> pandas.DataFrame:
     """Combine all of the data frames in the list to a single data frame."""
+    # a list with a single data frame needs no concatenation at all; return
+    # the data frame directly and avoid the full copy that concat would make
+    if len(data_frame_list) == 1:
+        return data_frame_list[0]
     # concatenate together all of the data frames in the list into a
-    # single data frame, useful for summarization or saving to file system
-    return pandas.concat(data_frame_list)
+    # single data frame, useful for summarization or saving to file system;
+    # avoiding the defensive copy and the hidden alphabetical column sort
+    # makes the concatenation lighter for wide data frames and a fresh
+    # index replaces the repeated per-file row numbers that concatenation
+    # of the individually loaded CSV files would otherwise produce
+    return pandas.concat(data_frame_list, copy=False, sort=False, ignore_index=True)
@@ -2,6 +2,7 @@
 
 from logging import Logger
 
+import functools
 import logging
 import logging.config
 
@@ -42,8 +43,13 @@ def configure_logging(
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def setup_console() -> Console:
     """Perform the setup steps and return a Console for terminal-based display."""
+    # note that this function is memoized because it is called throughout
+    # the program whenever terminal output is needed; constructing a new
+    # Console walks the capabilities of the terminal every time and the
+    # traceback installation only ever needs to take place a single time
     # configure the use of rich for improved terminal output:
     # --> rich-based tracebacks to enable better debugging on program crash
     configure_tracebacks()
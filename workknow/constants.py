@@ -23,6 +23,15 @@ data = create_constants(
 )
 
 
+# define the constants for the cache of responses from the GitHub API
+cache = create_constants(
+    "cache",
+    Etag="etag",
+    Links="links",
+    Workflow_Runs="workflow_runs",
+)
+
+
 # define the constants for environment variables
 environment = create_constants(
     "environment",
@@ -49,6 +58,9 @@ filesystem = create_constants(
     Csv_Commits_Glob="*-Commits.csv",
     Csv_Workflows_Glob="*-Workflows.csv",
     Dash="-",
+    Etag_Cache=".workknow-etag-cache",
+    Parquet_Extension=".parquet",
+    Parquet_Glob="*.parquet",
     Slash="/",
     Results="Results",
     Wildcard="*",
@@ -60,21 +72,33 @@ filesystem = create_constants(
 # define the constants for accessing GitHub
 github = create_constants(
     "github",
+    Accept_Encoding="Accept-Encoding",
+    Accept_Encoding_Brotli="br, gzip, deflate",
     Actions="actions/runs",
+    Ascii_Encoding="ascii",
+    Base64_Encoding="base64",
+    Blob_Mode="100644",
+    Blob_Type="blob",
     Api="api.github.com/repos/",
+    Etag="ETag",
     Https="https://",
+    If_None_Match="If-None-Match",
     Last="last",
+    Maximum_Backoff_Seconds=60,
     Maximum_Length_All=3,
     Maximum_Length_Record=25,
     Maximum_Request_Retries=10,
     Next="next",
+    Not_Modified_Response=304,
     Page="page",
     Page_Start=2,
     Per_Page="per_page",
     Per_Page_Maximum="100",
+    Retry_After="Retry-After",
     Separator="/",
     Success_Response=200,
     Url="url",
+    Utf8_Encoding="utf-8",
     User="User",
     User_Agent="User-Agent",
     Wait_In_Seconds=1,
@@ -139,6 +163,9 @@ rate = create_constants(
     Reset="reset",
     Resources="resources",
     Rate_Limit_Url="https://api.github.com/rate_limit",
+    Refresh_Threshold=50,
+    Remaining_Header="X-RateLimit-Remaining",
+    Reset_Header="X-RateLimit-Reset",
     Threshold=10,
 )
 
@@ -167,10 +194,13 @@ workflow = create_constants(
 # define the constants for workknow
 workknow = create_constants(
     "workknow",
+    Download_Worker_Count=4,
     Emoji=":light_bulb:",
     Https="https://",
     Name="WorkKnow",
+    Save_Worker_Count=4,
     Separator="/",
+    Session_Pool_Size=16,
     Tagline="WorkKnow: Know Your GitHub Actions Workflows!",
     Website="https://github.com/AnalyzeActions/WorkKnow",
 )
@@ -6,27 +6,59 @@ import zipfile
 from pathlib import Path
 
 from typing import List
+from typing import Optional
 
 import pandas
 
 from workknow import configure
 from workknow import constants
 
+# attempt to import the optional pyarrow package; when it is available the
+# CSV files are serialized by pyarrow's C++ writer, which writes the data
+# column by column and is substantially faster than the to_csv function in
+# Pandas for the large DataFrames that WorkKnow creates for big projects
+try:
+    import pyarrow  # type: ignore
+    from pyarrow import csv as pyarrow_csv  # type: ignore
 
-def read_csv_file(csv_data_file: Path) -> pandas.DataFrame:
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def read_csv_file(
+    csv_data_file: Path, usecols: Optional[List[str]] = None
+) -> pandas.DataFrame:
     """Read a CSV file and return it as a Pandas DataFrame."""
     # create an empty DataFrame for the situation in which
     # the program attempts to read a CSV file that does not
     # have any data in it and thus an exception is thrown
     data_frame_csv = pandas.DataFrame()
     try:
-        # try to read a tabular data set set stored in a CSV file
-        csv_file_data_frame = pandas.read_csv(str(csv_data_file))
+        # try to read a tabular data set set stored in a CSV file; when a
+        # list of column names is provided, only parse and store those
+        # columns, which substantially reduces the time and memory taken
+        # for wide CSV files of which only a single column is required
+        csv_file_data_frame = pandas.read_csv(str(csv_data_file), usecols=usecols)
         # there was no exception and thus it is fine to return the DataFrame
         return pandas.DataFrame(csv_file_data_frame)
     # the CSV file was empty and thus we must return an empty DataFrame
     except pandas.errors.EmptyDataError:
         return data_frame_csv
+    # the CSV file is malformed and thus the parse failure is a real defect
+    # in the input data that must propagate to the caller; this handler must
+    # come before the ValueError handler because ParserError is a subclass
+    # of ValueError and would otherwise be silently swallowed by it
+    except pandas.errors.ParserError:
+        raise
+    # the CSV file does not contain one of the requested columns and thus
+    # there is no usable data inside of it; return an empty DataFrame, but
+    # only when a list of columns was actually requested since any other
+    # ValueError signals a defect that must propagate to the caller
+    except ValueError:
+        if usecols is not None:
+            return data_frame_csv
+        raise
 
 
 def create_directory(directory: Path) -> None:
@@ -77,8 +109,15 @@ def save_dataframe_all(
     results_dir: Path,
     label: str,
     repo_data: pandas.DataFrame,
+    parquet: bool = False,
 ) -> None:
     """Save the provided DataFrame in a file in the results_dir with a label for all data sets."""
+    # the columnar Parquet format was requested for the combined data set;
+    # delegate to the Parquet writer, which encodes and compresses the data
+    # much faster than CSV and produces substantially smaller files
+    if parquet:
+        save_dataframe_all_parquet(results_dir, label, repo_data)
+        return
     # create the complete file path, making all parent directories
     # if needed and not failing if the directory already exists
     create_directory(results_dir)
@@ -100,9 +139,115 @@ def save_dataframe_all(
     complete_file_path = results_dir / file_name
     # resolve the complete file path to get its absolute name
     resolved_complete_file_path = complete_file_path.resolve()
-    # convert the pathlib Path object to a string and then use
-    # Pandas to save the file to the textualized path as a CSV file
-    repo_data.to_csv(str(resolved_complete_file_path))
+    # convert the pathlib Path object to a string and then save the
+    # data to the textualized path as a CSV file; the writer uses the
+    # fast pyarrow serializer whenever that package is available
+    write_dataframe_csv(repo_data, str(resolved_complete_file_path))
+
+
+def write_dataframe_csv(repo_data: pandas.DataFrame, file_path_name: str) -> None:
+    """Write a DataFrame to a CSV file, using the pyarrow writer when it is available."""
+    # the pyarrow package is available so use its fast columnar CSV writer
+    if PYARROW_AVAILABLE:
+        try:
+            pyarrow_table = pyarrow.Table.from_pandas(repo_data, preserve_index=False)
+            pyarrow_csv.write_csv(pyarrow_table, file_path_name)
+            return
+        # the DataFrame contains a column that pyarrow cannot serialize to
+        # CSV and thus the write must fall back to the Pandas implementation
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+            pass
+    # the pyarrow package is not available (or could not serialize this
+    # DataFrame) so use the standard CSV writer provided by Pandas
+    repo_data.to_csv(file_path_name, index=False)
+
+
+def save_dataframe_all_parquet(
+    results_dir: Path,
+    label: str,
+    repo_data: pandas.DataFrame,
+) -> None:
+    """Save the provided DataFrame in a Parquet file in the results_dir with a label for all data sets."""
+    # the pyarrow package is not available and thus the Parquet format
+    # cannot be written; fall back to saving the data in the CSV format
+    if not PYARROW_AVAILABLE:
+        save_dataframe_all(results_dir, label, repo_data)
+        return
+    # create the complete file path, making all parent directories
+    # if needed and not failing if the directory already exists
+    create_directory(results_dir)
+    # create the name of the file given the provided input details
+    file_name = (
+        constants.filesystem.All
+        + constants.filesystem.Dash
+        + label
+        + constants.filesystem.Parquet_Extension
+    )
+    # log the name of the file and the results directory
+    logger = logging.getLogger(constants.logging.Rich)
+    logger.debug(results_dir)
+    logger.debug(file_name)
+    # construct the complete file path including (in order):
+    # --> the fully qualified path for the results directory
+    # --> the full name of the file storing the data
+    complete_file_path = results_dir / file_name
+    # resolve the complete file path to get its absolute name
+    resolved_complete_file_path = complete_file_path.resolve()
+    # convert the pathlib Path object to a string and then save the data
+    # to the textualized path as a Parquet file; the columnar binary
+    # encoding avoids the textual conversion of every value that a CSV
+    # file requires and the zstd compression shrinks the file on disk
+    repo_data.to_parquet(
+        str(resolved_complete_file_path),
+        engine="pyarrow",
+        compression="zstd",
+        index=False,
+    )
+
+
+def append_dataframe_all(
+    results_dir: Path,
+    label: str,
+    repo_data: pandas.DataFrame,
+    include_header: bool,
+) -> None:
+    """Append the provided DataFrame to the file in the results_dir with a label for all data sets."""
+    # create the complete file path, making all parent directories
+    # if needed and not failing if the directory already exists
+    create_directory(results_dir)
+    # create the name of the file given the provided input details
+    file_name = (
+        constants.filesystem.All
+        + constants.filesystem.Dash
+        + label
+        + constants.filesystem.Csv_Extension
+    )
+    # log the name of the file and the results directory
+    logger = logging.getLogger(constants.logging.Rich)
+    logger.debug(results_dir)
+    logger.debug(file_name)
+    # construct the complete file path including (in order):
+    # --> the fully qualified path for the results directory
+    # --> the full name of the file storing the data
+    complete_file_path = results_dir / file_name
+    # resolve the complete file path to get its absolute name
+    resolved_complete_file_path = complete_file_path.resolve()
+    # the first append for a run must truncate any file left behind by a
+    # previous run and write the header; every later append only adds rows
+    if include_header:
+        file_mode = "w"
+    else:
+        file_mode = "a"
+    # convert the pathlib Path object to a string and then use Pandas to
+    # append the data to the textualized path as rows of a CSV file; the
+    # index is not written because the row numbers would otherwise restart
+    # for the data associated with each of the appended repositories
+    repo_data.to_csv(
+        str(resolved_complete_file_path),
+        mode=file_mode,
+        header=include_header,
+        index=False,
+    )
 
 
 def save_dataframe(
@@ -136,16 +281,19 @@ def save_dataframe(
     complete_file_path = results_dir / file_name
     # resolve the complete file path to get its absolute name
     resolved_complete_file_path = complete_file_path.resolve()
-    # convert the pathlib Path object to a string and then use
-    # Pandas to save the file to the textualized path as a CSV file
-    repo_data.to_csv(str(resolved_complete_file_path))
+    # convert the pathlib Path object to a string and then save the
+    # data to the textualized path as a CSV file; the writer uses the
+    # fast pyarrow serializer whenever that package is available
+    write_dataframe_csv(repo_data, str(resolved_complete_file_path))
 
 
 def create_results_zip_file_list(results_directory: Path) -> List[str]:
-    """Create a list of the .csv files in the provided results directory."""
-    results_files_generator = results_directory.glob("*.csv")
+    """Create a list of the .csv and .parquet files in the provided results directory."""
     results_file_list = []
-    for results_file in results_files_generator:
+    for results_file in results_directory.glob(constants.filesystem.Csv_Glob):
+        results_file_list.append(str(results_file))
+    # also collect any combined data sets saved in the Parquet format
+    for results_file in results_directory.glob(constants.filesystem.Parquet_Glob):
         results_file_list.append(str(results_file))
     return results_file_list
 
@@ -1,30 +1,308 @@
 """Command-line interface for the workknow program."""
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pathlib import Path
 
+import itertools
+import logging
+
+from typing import Dict
 from typing import List
 
-import pandas
 import typer
 
-from rich.pretty import pprint
-
-from workknow import concatenate
 from workknow import configure
 from workknow import constants
 from workknow import debug
 from workknow import display
 from workknow import environment
-from workknow import files
-from workknow import produce
-from workknow import release
-from workknow import request
+
+# Note that the modules that transitively import heavy packages, like
+# pandas, pytz, requests, and PyGithub, are deliberately imported inside
+# of the command functions that need them; importing pandas alone takes
+# hundreds of milliseconds and thus the deferral keeps the startup of the
+# command-line interface fast for commands that do not require a package
 
 
 # create a Typer object to supper the command-line interface
 cli = typer.Typer()
 
 
+def display_downloaded_data_summary(
+    console,
+    logger,
+    json_responses: List,
+    individual_builds_count: int,
+    peek: bool,
+    maximum_length_all: int,
+    maximum_length_record: int,
+) -> None:
+    """Display the count of the downloaded records and, optionally, a peek into them."""
+    # perform the deferred import of the heavy modules that this function requires
+    from rich.pretty import pprint
+
+    # STEP: print some details about the completed download
+    # --> display a peek into the downloaded data structure
+    if peek:
+        console.print()
+        console.print(
+            f":inbox_tray: Downloaded a total of {individual_builds_count} records that each look like:\n"
+        )
+        # STEP: print debugging information in a summarized fashion
+        pprint(
+            json_responses,
+            max_length=maximum_length_all,
+        )
+        if individual_builds_count != 0:
+            console.print()
+            console.print(":lion_face: The first workflow record looks like:\n")
+            pprint(
+                json_responses[0],
+                max_length=maximum_length_record,
+            )
+            # the guard avoids creating the textual version of
+            # an entire workflow record when debugging output is
+            # not going to be displayed in the terminal window
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(json_responses[0])
+        console.print()
+    # --> the program should not display a peek into the downloaded data structure
+    else:
+        console.print()
+        console.print(
+            f":inbox_tray: Downloaded a total of {individual_builds_count} records\n"
+        )
+
+
+def save_repository_results(
+    console,
+    save_executor: ThreadPoolExecutor,
+    save_futures: List,
+    results_dir: Path,
+    results_dir_valid: bool,
+    results_dir_text: str,
+    organization: str,
+    repo: str,
+    workflow_rows: List,
+    commit_rows: List,
+    skip_workflows: bool,
+    skip_commits: bool,
+    combine: bool,
+    first_workflows_append: bool,
+    workflows_label: str,
+    commits_label: str,
+) -> bool:
+    """Save the workflow and commit data for one repository and return the append flag."""
+    # perform the deferred import of the heavy modules that this function requires
+    from workknow import files
+    from workknow import produce
+
+    # the directory is valid so attempt a save to file system
+    if results_dir_valid:
+        console.print(
+            f":sparkles: Saving data for {organization}/{repo} in the directory {results_dir_text}"
+        )
+        # create the per-repository DataFrames out of the extracted
+        # rows since the save of this repository requires them;
+        # downcast the columns of each DataFrame so that repeated
+        # strings and wide integers do not inflate memory use
+        if not skip_workflows:
+            workflows_dataframe = produce.downcast_dataframe(
+                produce.create_workflows_dataframe_from_rows(workflow_rows)
+            )
+            console.print("\t... Saving the workflows data")
+            save_futures.append(
+                save_executor.submit(
+                    files.save_dataframe,
+                    results_dir,
+                    organization,
+                    repo,
+                    workflows_label,
+                    workflows_dataframe,
+                )
+            )
+            # STEP: stream this repository's workflow data onto the
+            # end of the combined workflows file when the creation of
+            # the combined data sets was requested; appending during
+            # the download keeps the memory use of the program flat
+            # instead of growing with every downloaded repository
+            if combine:
+                files.append_dataframe_all(
+                    results_dir,
+                    workflows_label,
+                    workflows_dataframe,
+                    first_workflows_append,
+                )
+                first_workflows_append = False
+        # save the commits DataFrame
+        if not skip_commits:
+            commits_dataframe = produce.downcast_dataframe(
+                produce.create_commits_dataframe_from_rows(commit_rows)
+            )
+            console.print("\t... Saving the commits data")
+            save_futures.append(
+                save_executor.submit(
+                    files.save_dataframe,
+                    results_dir,
+                    organization,
+                    repo,
+                    commits_label,
+                    commits_dataframe,
+                )
+            )
+    else:
+        # explain that the save could not work correctly due to invalid results directory
+        console.print(
+            f"Could not save workflow and commit data for {organization}/{repo} in the directory {results_dir_text}"
+        )
+        console.print()
+    return first_workflows_append
+
+
+def wait_for_repository_saves(
+    save_executor: ThreadPoolExecutor, save_futures: List
+) -> None:
+    """Wait until every backgrounded per-repository save finishes and surface any failure."""
+    # wait until every per-repository save submitted to the pool of worker
+    # threads has finished and then shut the pool down; the combined data
+    # sets and the zip file must only be created once every file is on disk
+    wait(save_futures)
+    # collect the result of every save so that an exception raised inside
+    # of a worker thread, like a full disk or a permission error, surfaces
+    # here instead of being silently discarded along with its future
+    for save_future in save_futures:
+        save_future.result()
+    save_executor.shutdown()
+
+
+def save_combined_results(
+    console,
+    results_dir: Path,
+    results_dir_valid: bool,
+    results_dir_text: str,
+    repos_csv_file: Path,
+    repos_csv_file_valid: bool,
+    all_commit_rows: List,
+    repo_url_workflow_record_columns: Dict[str, List],
+    skip_workflows: bool,
+    skip_commits: bool,
+    combine: bool,
+    parquet: bool,
+) -> None:
+    """Save the combined data sets that span every downloaded repository."""
+    # perform the deferred import of the heavy modules that this function requires
+    import pandas
+
+    from workknow import files
+    from workknow import produce
+
+    if results_dir_valid:
+        # finished processing all of the individual repositories and now ready to create
+        # the "combined" data sets that include data for every repository subject to analysis
+        console.print()
+        console.print(":runner: Creating combined data sets across all repositories")
+        # build the combined DataFrame for the commit data a single
+        # time out of the complete list of rows for all repositories,
+        # unless the commit data was explicitly skipped; note that the
+        # combined workflow data was already streamed to its CSV file
+        # incrementally during the download of each repository
+        if not skip_commits:
+            all_commits_dataframe = produce.downcast_dataframe(
+                produce.create_commits_dataframe_from_rows(all_commit_rows)
+            )
+        # combine the accumulated columns to create the DataFrame of
+        # workflow record data; since every column list already holds
+        # values of a single type, the constructor converts each one
+        # directly into an array without any per-row dtype inference
+        all_workflow_record_counts_dataframe = pandas.DataFrame(
+            repo_url_workflow_record_columns
+        )
+        console.print()
+        # Combine the data in the two data frames so that the count data (i.e., the number of
+        # workflow builds) is joined to the data about the repositories, as created by the
+        # project that reports data about the criticality of open-source projects. WorkKnow
+        # can only take this step if the user specified the CSV file from the criticality
+        # score project that contains multiple additional columns of data
+        if repos_csv_file_valid:
+            # read the complete CSV file, deferred until this point
+            # because the merge is the only step that requires the
+            # extra columns beyond the initially extracted URLs
+            provided_urls_data_frame = files.read_csv_file(repos_csv_file)
+            all_workflow_record_counts_dataframe_merged = (
+                produce.merge_repo_urls_with_count_data(
+                    provided_urls_data_frame,
+                    all_workflow_record_counts_dataframe,
+                )
+            )
+        # there was no specification of a CSV file on the command line and thus there is
+        # no extra data to record; in this situation the "merged" data file that will be
+        # saved is only the one that has the counts of the workflow builds for each project
+        else:
+            all_workflow_record_counts_dataframe_merged = (
+                all_workflow_record_counts_dataframe
+            )
+        # save the all records count DataFrame
+        # note that it is acceptable to save this
+        # DataFrame since it is always smaller in size
+        console.print(
+            f":sparkles: Saving combined data for all repositories in the directory {results_dir_text}"
+        )
+        console.print(
+            f"{constants.markers.Tab}... Saving combined workflow count data for all repositories"
+        )
+        files.save_dataframe_all(
+            results_dir,
+            constants.filesystem.Counts,
+            all_workflow_record_counts_dataframe_merged,
+            parquet,
+        )
+        # combine the individual data files into the (very very) large data files that include
+        # details about each of the repositories; note that the --combine argument will create
+        # data files that cannot be automatically uploaded to a GitHub repository due to the
+        # fact that they are going to be over 100 MB in size and thus require GitHub LFS
+        if combine:
+            # the combined workflows data was saved incrementally while
+            # each of the repositories was downloaded, so only report it
+            if not skip_workflows:
+                console.print(
+                    f"{constants.markers.Tab}... Saved combined workflows data for all repositories during download"
+                )
+            # save the all commits DataFrame
+            if not skip_commits:
+                console.print(
+                    f"{constants.markers.Tab}... Saving combined commits data for all repositories"
+                )
+                files.save_dataframe_all(
+                    results_dir,
+                    constants.filesystem.Commits,
+                    all_commits_dataframe,
+                    parquet,
+                )
+            # save a .zip file of all of the CSV files in the results directory
+            console.print()
+            console.print(
+                f":sparkles: Saving a Zip file of all results in the directory {results_dir_text}"
+            )
+            results_file_list = files.create_results_zip_file_list(results_dir)
+            files.create_results_zip_file(results_dir, results_file_list)
+    else:
+        console.print()
+        # explain that the save could not work correctly due to invalid results directory
+        console.print(
+            f":grimacing_face: Could not save workflow and commit details in the directory {results_dir_text}"
+        )
+        console.print(
+            constants.markers.Space
+            + constants.markers.Space
+            + constants.markers.Space
+            + "Did you specify a valid results directory?"
+            + constants.markers.Newline
+            + constants.markers.Newline
+            + ":sad_but_relieved_face: Exiting now!"
+        )
+
+
 @cli.command()
 def download(
     repo_urls: List[str] = typer.Option([]),
@@ -34,48 +312,121 @@ def download(
     combine: bool = typer.Option(False),
     peek: bool = typer.Option(False),
     save: bool = typer.Option(False),
+    skip_workflows: bool = typer.Option(False),
+    skip_commits: bool = typer.Option(False),
+    parquet: bool = typer.Option(False),
     debug_level: debug.DebugLevel = debug.DebugLevel.ERROR,
 ):
     """Download the GitHub Action workflow history of repositories in URL list and CSV file."""
+    # perform the deferred import of the heavy modules that this command requires
+    from workknow import files
+    from workknow import produce
+    from workknow import request
+
     # STEP: setup the console and the logger and then create a blank line for space
     console, logger = configure.setup(debug_level)
     # STEP: load the execution environment to support GitHub API access
     environment.load_environment(env_file, logger)
     # display the messages about the tool
     display.display_tool_details(debug_level)
-    # create empty lists of the data frames
-    repository_urls_dataframes_workflows = []
-    repository_urls_dataframes_commits = []
+    # create an empty list of the commit detail row dictionaries across all
+    # repositories; the commit data must stay in memory until the end of the
+    # run because its flattened schema can vary from repository to repository.
+    # The workflow data has a stable schema and thus it is streamed to the
+    # combined CSV file incrementally instead of being accumulated in memory
+    all_commit_rows: List = []
+    # the first incremental append to the combined workflows file must
+    # truncate any previous file and write the header row a single time
+    first_workflows_append = True
     # assume that the repos_csv_file was not specified and prove otherwise
     repos_csv_file_valid = False
     # STEP: get any rate limit details and stop using the program
-    # if it is in danger of being rate limited and not having data
-    request.get_rate_limit_details()
+    # if it is in danger of being rate limited and not having data;
+    # the request module records the remaining request budget from the
+    # headers of every data response so that the rate limit endpoint
+    # does not have to be contacted again for every repository, which
+    # would itself cost an extra HTTP round-trip each time
+    request.check_local_rate_state()
     # STEP: read the CSV file and extract its data into a Pandas DataFrame
+    # create an empty list of the repository URLs provided in a CSV file
+    # for the situation in which there is no valid CSV file to read
+    provided_url_list: List[str] = []
     # there is a valid CSV file of repository data
-    # create an empty DataFrame in case the CSV file specified on the
-    # command-line is not valid or, alternatively, it is not specified at all
-    provided_urls_data_frame = pandas.DataFrame()
     if files.confirm_valid_file(repos_csv_file):
         repos_csv_file_valid = True
-        # read the CSV file and produce a Pandas DataFrame out of it
-        provided_urls_data_frame = files.read_csv_file(repos_csv_file)
+        # read only the "url" column of the CSV file and produce a Pandas
+        # DataFrame out of it; a CSV file like the one from the criticality
+        # score project contains many extra columns that are not needed at
+        # this stage and the complete file is only read again later when
+        # its extra columns are required for the merge with the count data
+        url_only_data_frame = files.read_csv_file(
+            repos_csv_file, usecols=[constants.data.Url]
+        )
         # extract the repository URLs from the data frame;
         # note that the (documented) assumption is that the CSV file
         # must have a column called "url" that contains the URLs and
         # that the WorkKnow will ignore all other data inside of the CSV file
-        provided_url_list = produce.extract_repo_urls_list(provided_urls_data_frame)
-        # since Typer seems to convert repo_urls into a tuple, convert it to a list
-        repo_urls = list(repo_urls)
-        # add the URLs extracted from the CSV file into the repo_urls list
-        repo_urls.extend(provided_url_list)
-        # display debugging information about the data frames
-        logger.debug(repo_urls)
-    repo_url_workflow_record_list = []
+        provided_url_list = produce.extract_repo_urls_list(url_only_data_frame)
+        # display debugging information about the data frames; the guard
+        # avoids creating the textual version of a potentially long list
+        # of URLs when debugging output is not going to be displayed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(provided_url_list)
+    # merge the URLs provided on the command-line (which Typer seems to
+    # convert into a tuple) with the URLs extracted from the CSV file and
+    # remove any duplicate repository URLs while preserving the order in
+    # which they were provided; a CSV file like the one from the criticality
+    # score project can list the same repository multiple times and every
+    # duplicate would otherwise cost extra requests to the GitHub API. The
+    # chain of the two sources feeds the deduplication directly and thus
+    # avoids materializing an intermediate merged list of the URLs
+    repo_urls_count_with_duplicates = len(repo_urls) + len(provided_url_list)
+    repo_urls = list(dict.fromkeys(itertools.chain(repo_urls, provided_url_list)))
+    duplicate_repo_urls_count = repo_urls_count_with_duplicates - len(repo_urls)
+    # at least one duplicate was removed, so display a diagnostic message
+    if duplicate_repo_urls_count != 0:
+        console.print(
+            f":recycle: Removed {duplicate_repo_urls_count} duplicate repository URL(s) before download"
+        )
+    # create a dictionary that maps each column name for the workflow record
+    # count data to a growing list of that column's values; accumulating the
+    # counts column by column means that the terminal DataFrame construction
+    # receives homogeneous columns and performs no per-row dtype inference
+    repo_url_workflow_record_columns: Dict[str, List] = {}
+    # create a small pool of worker threads so that the saving of the CSV
+    # files for one repository can overlap with the download of the next
+    # repository; the per-repository save operations write independent files
+    save_executor = ThreadPoolExecutor(max_workers=constants.workknow.Save_Worker_Count)
+    save_futures: List = []
+    # determine whether the results directory is valid a single time before
+    # the download loop starts; this avoids repeating the directory creation
+    # and the file system checks for every repository that is downloaded
+    results_dir_valid = False
+    if save:
+        results_dir_valid = files.confirm_valid_directory(results_dir)
+    # create the textual version of the results directory a single time
+    # since it appears in many of the diagnostic messages that follow
+    results_dir_text = constants.markers.Nothing
+    if results_dir is not None:
+        results_dir_text = str(results_dir).strip()
+    # store the on-disk cache of GitHub API responses in the results directory
+    # when it is valid; the cache lets a later run of WorkKnow make conditional
+    # requests that do not count against the rate limit for unchanged data
+    response_cache_dir = None
+    if results_dir_valid:
+        response_cache_dir = results_dir
+    # bind the constants that are accessed inside of the download loop to
+    # local names a single time; every namedtuple attribute access performs
+    # lookup work that does not need to be repeated for each repository
+    maximum_length_all = constants.github.Maximum_Length_All
+    maximum_length_record = constants.github.Maximum_Length_Record
+    workflows_label = constants.filesystem.Workflows
+    commits_label = constants.filesystem.Commits
     # the user did, in fact, specify repositories for analysis
     if len(repo_urls) != 0:
         # display debugging information about the data frames
-        logger.debug(repo_urls)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(repo_urls)
         # iterate through all of the repo_urls provided on the command-line or in the CSV file
         for repo_url in repo_urls:
             # STEP: create the URL needed for accessing the repository's Action builds
@@ -89,205 +440,123 @@ def download(
                 console.print(github_api_url, style="link " + github_api_url)
                 console.print()
                 # STEP: access the JSON file that contains the build history
-                (valid, _, _, json_responses) = request.request_json_from_github(
-                    github_api_url, console
+                valid, _, _, json_responses = request.request_json_from_github(
+                    github_api_url, console, cache_dir=response_cache_dir
                 )
                 # the data returned from the API is valid; this means that either no difficulties
                 # were encountered or, alternatively, there were difficulties but a series of
                 # one or more retries allowed for the "waiting out" of the problem and the
                 # ultimate collection of valid data that can now be extracted and saved
                 if valid:
+                    # count the number of individual builds a single time since the
+                    # count is displayed in several of the following diagnostics
+                    individual_builds_count = produce.count_individual_builds(
+                        json_responses
+                    )
                     # STEP: collect data about the number of workflow records in the JSON responses
                     repo_url_workflow_record_dict = (
                         produce.create_workflow_record_count_dictionary(
-                            organization, repo, repo_url, github_api_url, json_responses
-                        )
-                    )
-                    repo_url_workflow_record_list.append(repo_url_workflow_record_dict)
-                    # STEP: print some details about the completed download
-                    # --> display a peek into the downloaded data structure
-                    if peek:
-                        console.print()
-                        console.print(
-                            f":inbox_tray: Downloaded a total of {produce.count_individual_builds(json_responses)} records that each look like:\n"
-                        )
-                        # STEP: print debugging information in a summarized fashion
-                        pprint(
+                            organization,
+                            repo,
+                            repo_url,
+                            github_api_url,
                             json_responses,
-                            max_length=constants.github.Maximum_Length_All,
-                        )
-                        if produce.count_individual_builds(json_responses) != 0:
-                            console.print()
-                            console.print(
-                                ":lion_face: The first workflow record looks like:\n"
-                            )
-                            pprint(
-                                json_responses[0][0],
-                                max_length=constants.github.Maximum_Length_Record,
-                            )
-                            logger.debug(json_responses[0][0])
-                        console.print()
-                    # --> the program should not display a peek into the downloaded data structure
-                    else:
-                        console.print()
-                        console.print(
-                            f":inbox_tray: Downloaded a total of {produce.count_individual_builds(json_responses)} records\n"
+                            individual_builds_count,
                         )
-                    # STEP: create the workflows DataFrame
-                    workflows_dataframe = produce.create_workflows_dataframe(
-                        organization, repo, repo_url, github_api_url, json_responses
                     )
-                    repository_urls_dataframes_workflows.append(workflows_dataframe)
-                    # STEP: create the commit details DataFrame
-                    commits_dataframe = produce.create_commits_dataframe(
-                        organization, repo, repo_url, github_api_url, json_responses
+                    for (
+                        record_key,
+                        record_value,
+                    ) in repo_url_workflow_record_dict.items():
+                        repo_url_workflow_record_columns.setdefault(
+                            record_key, []
+                        ).append(record_value)
+                    # STEP: print some details about the completed download,
+                    # including a peek into the data structure when requested
+                    display_downloaded_data_summary(
+                        console,
+                        logger,
+                        json_responses,
+                        individual_builds_count,
+                        peek,
+                        maximum_length_all,
+                        maximum_length_record,
                     )
-                    repository_urls_dataframes_commits.append(commits_dataframe)
-                    # STEP: save the workflows DataFrame when saving is stipulated and
-                    # the results directory is valid for the user's file system
-                    # save the workflows DataFrame
+                    # STEP: extract the workflow rows for this repository, but
+                    # only when the workflow data was not explicitly skipped
+                    workflow_rows = []
+                    if not skip_workflows:
+                        workflow_rows = produce.create_workflow_rows(
+                            organization, repo, repo_url, github_api_url, json_responses
+                        )
+                    # STEP: extract the commit detail rows for this repository and
+                    # add them to the running list of rows for all repositories,
+                    # but only when the combined data sets will actually be created
+                    # and the commit data was not explicitly skipped
+                    commit_rows = []
+                    if not skip_commits:
+                        commit_rows = produce.create_commit_rows(
+                            organization, repo, repo_url, github_api_url, json_responses
+                        )
+                        if save and combine:
+                            all_commit_rows.extend(commit_rows)
+                    # STEP: save the workflows and commits DataFrames when saving is
+                    # stipulated and the results directory is valid for the user's
+                    # file system; the save of this repository is submitted to the
+                    # pool of worker threads so that it can overlap the next download
                     if save:
-                        # the directory is valid so attempt a save to file system
-                        if files.confirm_valid_directory(results_dir):
-                            console.print(
-                                f":sparkles: Saving data for {organization}/{repo} in the directory {str(results_dir).strip()}"
-                            )
-                            console.print("\t... Saving the workflows data")
-                            files.save_dataframe(
-                                results_dir,
-                                organization,
-                                repo,
-                                constants.filesystem.Workflows,
-                                workflows_dataframe,
-                            )
-                            # save the commits DataFrame
-                            console.print("\t... Saving the commits data")
-                            files.save_dataframe(
-                                results_dir,
-                                organization,
-                                repo,
-                                constants.filesystem.Commits,
-                                commits_dataframe,
-                            )
-                        else:
-                            # explain that the save could not work correctly due to invalid results directory
-                            console.print(
-                                f"Could not save workflow and commit data for {organization}/{repo} in the directory {str(results_dir).strip()}"
-                            )
-                            console.print()
+                        first_workflows_append = save_repository_results(
+                            console,
+                            save_executor,
+                            save_futures,
+                            results_dir,
+                            results_dir_valid,
+                            results_dir_text,
+                            organization,
+                            repo,
+                            workflow_rows,
+                            commit_rows,
+                            skip_workflows,
+                            skip_commits,
+                            combine,
+                            first_workflows_append,
+                            workflows_label,
+                            commits_label,
+                        )
                     # before going on to the next GitHub repository, ensure that the program
-                    # is not about to be rate limited, which will cause a crash. If a rate
-                    # limit is imminent then sleep for the time remaining until GitHub resets.
-                    rate_limit_dict = request.get_rate_limit_details()
-                    request.get_rate_limit_wait_time_and_wait(rate_limit_dict)
+                    # is not about to be rate limited, which will cause a crash. The budget
+                    # recorded from the X-RateLimit headers of the downloaded responses means
+                    # that the rate limit endpoint is only contacted when the budget is
+                    # getting low; if a rate limit is imminent then sleep until the reset.
+                    request.check_local_rate_state()
                 else:
                     console.print()
                     # explain that the save could not work correctly due to invalid results directory
                     console.print(
                         f":grimacing_face: Could not download workflow and commit details for {organization}/{repo}"
                     )
+        # wait until every backgrounded per-repository save has finished,
+        # surfacing any save failure, before the combined data sets and
+        # the zip file are created out of the files that are now on disk
+        wait_for_repository_saves(save_executor, save_futures)
         # now that WorkKnow is finished with the processing of each of the individual repositories and
         # they are stored in the currently in-memory DataFrames, save the required data to disk;
         # however, only save all of the results in the file system if the save parameter is specified
         if save:
-            if files.confirm_valid_directory(results_dir):
-                # finished processing all of the individual repositories and now ready to create
-                # the "combined" data sets that include data for every repository subject to analysis
-                console.print()
-                console.print(
-                    ":runner: Creating combined data sets across all repositories"
-                )
-                # combine all of the individual DataFrames for the workflow data
-                all_workflows_dataframe = pandas.concat(
-                    repository_urls_dataframes_workflows
-                )
-                # combine all of the individual DataFrames for the commit data
-                all_commits_dataframe = pandas.concat(
-                    repository_urls_dataframes_commits
-                )
-                # combine all of the dictionaries in the list to create DataFrame of workflow record data
-                all_workflow_record_counts_dataframe = pandas.DataFrame(
-                    repo_url_workflow_record_list
-                )
-                console.print()
-                # Combine the data in the two data frames so that the count data (i.e., the number of
-                # workflow builds) is joined to the data about the repositories, as created by the
-                # project that reports data about the criticality of open-source projects. WorkKnow
-                # can only take this step if the user specified the CSV file from the criticality
-                # score project that contains multiple additional columns of data
-                if repos_csv_file_valid:
-                    all_workflow_record_counts_dataframe_merged = (
-                        produce.merge_repo_urls_with_count_data(
-                            provided_urls_data_frame,
-                            all_workflow_record_counts_dataframe,
-                        )
-                    )
-                # there was no specification of a CSV file on the command line and thus there is
-                # no extra data to record; in this situation the "merged" data file that will be
-                # saved is only the one that has the counts of the workflow builds for each project
-                else:
-                    all_workflow_record_counts_dataframe_merged = (
-                        all_workflow_record_counts_dataframe
-                    )
-                # save the all records count DataFrame
-                # note that it is acceptable to save this
-                # DataFrame since it is always smaller in size
-                console.print(
-                    f":sparkles: Saving combined data for all repositories in the directory {str(results_dir).strip()}"
-                )
-                console.print(
-                    f"{constants.markers.Tab}... Saving combined workflow count data for all repositories"
-                )
-                files.save_dataframe_all(
-                    results_dir,
-                    constants.filesystem.Counts,
-                    all_workflow_record_counts_dataframe_merged,
-                )
-                # combine the individual data files into the (very very) large data files that include
-                # details about each of the repositories; note that the --combine argument will create
-                # data files that cannot be automatically uploaded to a GitHub repository due to the
-                # fact that they are going to be over 100 MB in size and thus require GitHub LFS
-                if combine:
-                    # save the all workflows DataFrame
-                    console.print(
-                        f"{constants.markers.Tab}... Saving combined workflows data for all repositories"
-                    )
-                    files.save_dataframe_all(
-                        results_dir,
-                        constants.filesystem.Workflows,
-                        all_workflows_dataframe,
-                    )
-                    # save the all commits DataFrame
-                    console.print(
-                        f"{constants.markers.Tab}... Saving combined commits data for all repositories"
-                    )
-                    files.save_dataframe_all(
-                        results_dir,
-                        constants.filesystem.Commits,
-                        all_commits_dataframe,
-                    )
-                    # save a .zip file of all of the CSV files in the results directory
-                    console.print()
-                    console.print(
-                        f":sparkles: Saving a Zip file of all results in the directory {str(results_dir).strip()}"
-                    )
-                    results_file_list = files.create_results_zip_file_list(results_dir)
-                    files.create_results_zip_file(results_dir, results_file_list)
-            else:
-                console.print()
-                # explain that the save could not work correctly due to invalid results directory
-                console.print(
-                    f":grimacing_face: Could not save workflow and commit details in the directory {str(results_dir).strip()}"
-                )
-                console.print(
-                    constants.markers.Space
-                    + constants.markers.Space
-                    + constants.markers.Space
-                    + "Did you specify a valid results directory?"
-                    + constants.markers.Newline
-                    + constants.markers.Newline
-                    + ":sad_but_relieved_face: Exiting now!"
-                )
+            save_combined_results(
+                console,
+                results_dir,
+                results_dir_valid,
+                results_dir_text,
+                repos_csv_file,
+                repos_csv_file_valid,
+                all_commit_rows,
+                repo_url_workflow_record_columns,
+                skip_workflows,
+                skip_commits,
+                combine,
+                parquet,
+            )
             console.print()
             request.get_rate_limit_details()
     # there were no valid repository URLs provided on the command-line so workflow analysis could not proceed
@@ -316,6 +585,10 @@ def upload(
     debug_level: debug.DebugLevel = debug.DebugLevel.ERROR,
 ):
     """Upload to a GitHub release the data in the results directory."""
+    # perform the deferred import of the heavy modules that this command requires
+    from workknow import produce
+    from workknow import release
+
     # STEP: setup the console and the logger instance
     console, logger = configure.setup(debug_level)
     # STEP: load the execution environment to support GitHub API access
@@ -351,9 +624,14 @@ def combine(
     results_dir: Path = typer.Option(None),
     env_file: Path = typer.Option(None),
     save: bool = typer.Option(False),
+    parquet: bool = typer.Option(False),
     debug_level: debug.DebugLevel = debug.DebugLevel.ERROR,
 ):
     """Combine the downloaded GitHub Action workflow and commit history for all projects in a specified directory."""
+    # perform the deferred import of the heavy modules that this command requires
+    from workknow import concatenate
+    from workknow import files
+
     # STEP: setup the console and the logger and then create a blank line for space
     console, logger = configure.setup(debug_level)
     # STEP: load the execution environment to support GitHub API access
@@ -393,6 +671,7 @@ def combine(
                     results_dir,
                     constants.filesystem.Counts,
                     data_frame_counts,
+                    parquet,
                 )
                 console.print(
                     f"{constants.markers.Tab}... Saving combined workflows data for all repositories"
@@ -403,6 +682,7 @@ def combine(
                     results_dir,
                     constants.filesystem.Workflows,
                     data_frame_workflows,
+                    parquet,
                 )
                 console.print(
                     f"{constants.markers.Tab}... Saving combined commits data for all repositories"
@@ -413,6 +693,7 @@ def combine(
                     results_dir,
                     constants.filesystem.Commits,
                     data_frame_commits,
+                    parquet,
                 )
                 console.print()
 
@@ -1,11 +1,12 @@
 """Create content from containers and strings."""
 
+import functools
 import logging
 
+from typing import AbstractSet
 from typing import Any
 from typing import Dict
 from typing import List
-from typing import Set
 from typing import Tuple
 from typing import Union
 
@@ -16,12 +17,18 @@ import pandas
 from workknow import constants
 
 
+@functools.lru_cache(maxsize=None)
 def parse_github_url(github_url: str) -> Tuple[Union[str, None], Union[str, None]]:
     """Parse a GitHub URL using the giturlparse package returning names of organization and repository."""
-    # the provided github_url is valid and can be parsed
-    if parse(github_url).valid:
-        # parse the parse-able github_url
-        github_url_parse = parse(github_url)
+    # note that the memoization is safe because this function is a pure
+    # function of its string input; it avoids repeating the parsing work
+    # when the same URL appears multiple times in the provided inputs
+    # parse the provided github_url a single time; the parser runs a regular
+    # expression match internally and thus parsing once and then checking
+    # validity halves the cost of this function on the ingestion path
+    github_url_parse = parse(github_url)
+    # the provided github_url is valid and was parsed
+    if github_url_parse.valid:
         # extract the owner (i.e., organization) and repo fields
         # and return them both in a tuple
         organization = github_url_parse.owner  # type: ignore
@@ -31,34 +38,32 @@ def parse_github_url(github_url: str) -> Tuple[Union[str, None], Union[str, None
     return (None, None)
 
 
+@functools.lru_cache(maxsize=None)
 def create_github_api_url(organization: str, repo: str) -> str:
     """Create a valid GitHub API URL out of the organization and repo name."""
     # Example:
     # https://api.github.com/repos/gkapfham/meSMSage/actions/runs
     logger = logging.getLogger(constants.logging.Rich)
+    # build the URL with a single f-string, which the interpreter compiles
+    # to one string construction instead of a chain of concatenations that
+    # each allocate an intermediate string
     github_api_url = (
-        constants.github.Https
-        + constants.github.Api
-        + organization
-        + constants.github.Separator
-        + repo
-        + constants.github.Separator
-        + constants.github.Actions
+        f"{constants.github.Https}{constants.github.Api}"
+        f"{organization}{constants.github.Separator}"
+        f"{repo}{constants.github.Separator}{constants.github.Actions}"
     )
-    logger.debug("Created the GitHub API URL: " + github_api_url)
+    # let the logging subsystem perform the message formatting so that it
+    # only happens when the debugging output is actually going to appear
+    logger.debug("Created the GitHub API URL: %s", github_api_url)
     return github_api_url
 
 
 def count_individual_builds(json_responses: List[Dict[Any, Any]]) -> int:
-    """Count the number of lists inside of the nested list."""
-    running_build_total = 0
-    # iterate through each of the JSON responses in the list and
-    # count the number of dicts inside of the list. Note that each
-    # of these dicts corresponds to one of the build entries.
-    for internal_json_responses in json_responses:
-        running_build_total = running_build_total + len(internal_json_responses)
-    # return the running total of builds
-    return running_build_total
+    """Count the number of build entries inside of the flat list."""
+    # each of the dicts inside of the flat list of JSON responses
+    # corresponds to exactly one of the build entries and thus the count
+    # of the builds is the constant-time length of the list itself
+    return len(json_responses)
 
 
 def create_subsetted_list_dict(
@@ -66,52 +71,56 @@ def create_subsetted_list_dict(
     repo: str,
     repo_url: str,
     github_api_url: str,
-    subset_key_names: Set,
+    subset_key_names: AbstractSet,
     workflows_dictionary_list: List[Dict[Any, Any]],
 ) -> List[Dict[Any, Any]]:
     """Create a list of dictionaries of all of the relevant workflow data."""
-    # create an empty list that will store dictionaries to be made into
-    # rows of a Pandas DataFrame. This approach avoids the need to incrementally
+    # create a list that will store dictionaries to be made into rows of a
+    # Pandas DataFrame. This approach avoids the need to incrementally
     # add rows to a Pandas DataFrame, which is known to be inefficient.
-    total_workflow_list = []
-    # iterate through the outer list that contains a separate list for each
-    # of the separate pages returned from the GitHub API
-    for current_workflow_dictionary_inner_list in workflows_dictionary_list:
-        # iterate through the inner list which contains a dictionary for each
-        # "row" in the JSON file that was returned from the GitHub API
-        for current_workflow_dictionary in current_workflow_dictionary_inner_list:
-            # only keep those key-value pairs that are for keys in subset_key_names
-            chosen_keys_values = {
-                key: value
-                for key, value in current_workflow_dictionary.items()
-                if key in subset_key_names
-            }
-            # to ensure that the data set is self contained (and also to ensure that
-            # records for multiple projects can be stored in the same "All" DataFrame),
-            # include the organization name, repository name, and full repository URL
-            # inside of the dictionary before it is stored inside of the list
-            chosen_keys_values[constants.workflow.Organization] = organization
-            chosen_keys_values[constants.workflow.Repo] = repo
-            chosen_keys_values[constants.workflow.Repo_Url] = repo_url
-            chosen_keys_values[constants.workflow.Actions_Url] = github_api_url
-            # add the list of chosen key-value pairs to the list of workflow details
-            total_workflow_list.append(chosen_keys_values)
+    # Since the flat list of workflow dictionaries reveals the total number
+    # of rows up front, the list is allocated at its final size a single
+    # time and filled in by index, avoiding the repeated geometric
+    # reallocation that appending the rows one at a time would perform
+    total_workflow_list: List[Dict[Any, Any]] = [None] * len(  # type: ignore
+        workflows_dictionary_list
+    )
+    current_workflow_index = 0
+    # iterate through the flat list which contains a dictionary for each
+    # "row" in the JSON files that were returned from the GitHub API
+    for current_workflow_dictionary in workflows_dictionary_list:
+        # only keep those key-value pairs that are for keys in subset_key_names;
+        # iterating through the small set of subset keys instead of every item
+        # in the dictionary performs far fewer lookups per row because a
+        # workflow dictionary from the GitHub API contains many extra keys
+        chosen_keys_values = {
+            key: current_workflow_dictionary[key]
+            for key in subset_key_names
+            if key in current_workflow_dictionary
+        }
+        # to ensure that the data set is self contained (and also to ensure that
+        # records for multiple projects can be stored in the same "All" DataFrame),
+        # include the organization name, repository name, and full repository URL
+        # inside of the dictionary before it is stored inside of the list
+        chosen_keys_values[constants.workflow.Organization] = organization
+        chosen_keys_values[constants.workflow.Repo] = repo
+        chosen_keys_values[constants.workflow.Repo_Url] = repo_url
+        chosen_keys_values[constants.workflow.Actions_Url] = github_api_url
+        # store the dictionary of chosen key-value pairs in the next
+        # position of the pre-allocated list of workflow details
+        total_workflow_list[current_workflow_index] = chosen_keys_values
+        current_workflow_index = current_workflow_index + 1
     # return the list of dicts so that calling method can analyze it further
     # or create a Pandas data frame out of it
     return total_workflow_list
 
 
-def create_workflows_dataframe(
-    organization: str,
-    repo: str,
-    repo_url: str,
-    github_api_url: str,
-    workflows_dictionary_list: List[Dict[Any, Any]],
-) -> pandas.DataFrame:
-    """Create a DataFrame of all of the relevant workflow data."""
-    # create a tuple of the key names that we want to retain from
-    # those keys that are inside of all those in a dictionary (row) of data
-    subset_key_names = {
+# the key names that should be retained from those keys that are inside
+# of every workflow dictionary (row) of data; the frozenset is created a
+# single time at the level of the module so that the repeated constant
+# lookups and the set construction are not paid again for every repository
+WORKFLOW_SUBSET_KEY_NAMES = frozenset(
+    {
         constants.workflow.Id,
         constants.workflow.Name,
         constants.workflow.Head_Sha,
@@ -123,63 +132,246 @@ def create_workflows_dataframe(
         constants.workflow.Jobs_Url,
         constants.workflow.Actions_Url,
     }
-    total_workflow_list = create_subsetted_list_dict(
+)
+
+# the key names that should be retained for the commit message data; the
+# nested head_commit dictionary holds all of the relevant commit details
+COMMIT_SUBSET_KEY_NAMES = frozenset(
+    {
+        constants.workflow.Head_Commit,
+    }
+)
+
+
+def create_workflow_rows(
+    organization: str,
+    repo: str,
+    repo_url: str,
+    github_api_url: str,
+    workflows_dictionary_list: List[Dict[Any, Any]],
+) -> List[Dict[Any, Any]]:
+    """Create a list of row dictionaries of all of the relevant workflow data."""
+    return create_subsetted_list_dict(
         organization,
         repo,
         repo_url,
         github_api_url,
-        subset_key_names,
+        WORKFLOW_SUBSET_KEY_NAMES,
         workflows_dictionary_list,
     )
-    total_workflow_dataframe = pandas.DataFrame(total_workflow_list)
+
+
+# the stable order of the columns inside of every workflows DataFrame; an
+# explicit column order ensures that the workflow data for every repository
+# has an identical schema, which makes it possible to append the data for
+# one repository after another inside of a single combined CSV file
+WORKFLOW_COLUMN_NAMES = [
+    constants.workflow.Id,
+    constants.workflow.Name,
+    constants.workflow.Head_Sha,
+    constants.workflow.Created_At,
+    constants.workflow.Updated_At,
+    constants.workflow.Event,
+    constants.workflow.Status,
+    constants.workflow.Conclusion,
+    constants.workflow.Jobs_Url,
+    constants.workflow.Organization,
+    constants.workflow.Repo,
+    constants.workflow.Repo_Url,
+    constants.workflow.Actions_Url,
+]
+
+
+# the names of the columns that store a small number of repeated string
+# values; converting these columns to the categorical type inside of Pandas
+# stores every distinct string a single time, which substantially reduces
+# the memory that a DataFrame with many workflow builds would consume
+CATEGORY_COLUMN_NAMES = [
+    constants.workflow.Organization,
+    constants.workflow.Repo,
+    constants.workflow.Repo_Url,
+    constants.workflow.Actions_Url,
+    constants.workflow.Name,
+    constants.workflow.Event,
+    constants.workflow.Status,
+    constants.workflow.Conclusion,
+]
+
+# the names of the columns that store numeric identifiers that Pandas can
+# downcast from the default 64-bit representation to a smaller integer type
+INTEGER_COLUMN_NAMES = [
+    constants.workflow.Id,
+]
+
+
+def downcast_dataframe(data_frame: pandas.DataFrame) -> pandas.DataFrame:
+    """Downcast the columns of a DataFrame to reduce the memory that it consumes."""
+    # convert every low-cardinality string column that exists inside of the
+    # DataFrame to the categorical type; note that saving a categorical
+    # column to a CSV file produces exactly the same textual output
+    for column_name in CATEGORY_COLUMN_NAMES:
+        if column_name in data_frame:
+            data_frame[column_name] = data_frame[column_name].astype("category")
+    # downcast every numeric identifier column to the smallest integer type
+    # that can still represent all of the values inside of the column
+    for column_name in INTEGER_COLUMN_NAMES:
+        if column_name in data_frame:
+            data_frame[column_name] = pandas.to_numeric(
+                data_frame[column_name], downcast="integer"
+            )
+    return data_frame
+
+
+def create_workflows_dataframe_from_rows(
+    total_workflow_list: List[Dict[Any, Any]],
+) -> pandas.DataFrame:
+    """Create a DataFrame out of a list of row dictionaries of workflow data."""
+    # there are no rows of workflow data, which is common for repositories
+    # that never ran a workflow; immediately return an empty DataFrame that
+    # still carries the stable schema so that downstream saving keeps working
+    if not total_workflow_list:
+        return pandas.DataFrame(columns=WORKFLOW_COLUMN_NAMES)
+    # build the DataFrame a single time out of the complete list of rows;
+    # this avoids the repeated construction and concatenation of many small
+    # intermediate DataFrames, which is known to be inefficient in Pandas;
+    # the explicit column names guarantee a stable schema for every repository.
+    # Transposing the rows into one list for each column before the
+    # construction lets Pandas convert every column directly into an array
+    # instead of performing its much slower row-by-row alignment and dtype
+    # inference over the list of dictionaries
+    column_values = {
+        column_name: [row.get(column_name) for row in total_workflow_list]
+        for column_name in WORKFLOW_COLUMN_NAMES
+    }
+    total_workflow_dataframe = pandas.DataFrame(
+        column_values, columns=WORKFLOW_COLUMN_NAMES
+    )
     return total_workflow_dataframe
 
 
-def create_commits_dataframe(
+def create_workflows_dataframe(
     organization: str,
     repo: str,
     repo_url: str,
     github_api_url: str,
     workflows_dictionary_list: List[Dict[Any, Any]],
 ) -> pandas.DataFrame:
-    """Create a DataFrame of all the relevant commit message data."""
-    # create a tuple of the key names that we want to retain from
-    # those keys that are inside of all those in a dictionary (row) of data
-    subset_key_names = {
-        constants.workflow.Head_Commit,
-    }
-    # print(workflows_dictionary_list)
-    # create a subsetted list given the key names
-    commits_list = create_subsetted_list_dict(
+    """Create a DataFrame of all of the relevant workflow data."""
+    # extract the list of row dictionaries for this repository and then
+    # create the DataFrame for it in a single construction step
+    total_workflow_list = create_workflow_rows(
         organization,
         repo,
         repo_url,
         github_api_url,
-        subset_key_names,
         workflows_dictionary_list,
     )
+    return create_workflows_dataframe_from_rows(total_workflow_list)
+
+
+def create_commit_rows(
+    organization: str,
+    repo: str,
+    repo_url: str,
+    github_api_url: str,
+    workflows_dictionary_list: List[Dict[Any, Any]],
+) -> List[Dict[Any, Any]]:
+    """Create a list of row dictionaries of all the relevant commit message data."""
+    # create a subsetted list given the module-level commit key names
+    return create_subsetted_list_dict(
+        organization,
+        repo,
+        repo_url,
+        github_api_url,
+        COMMIT_SUBSET_KEY_NAMES,
+        workflows_dictionary_list,
+    )
+
+
+def flatten_nested_dictionary(
+    nested_dictionary: Dict[Any, Any],
+    flat_dictionary: Dict[str, Any],
+    parent_key: str,
+) -> None:
+    """Flatten a nested dictionary into the flat dictionary, joining the keys with an underscore."""
+    # iterate through every key-value pair in the current dictionary and
+    # either recurse into a nested dictionary or record the flattened value
+    for key, value in nested_dictionary.items():
+        # join the name of the current key onto the name of its parent key
+        # so that, for instance, the "name" key nested inside of the
+        # "author" key of "head_commit" becomes "head_commit_author_name"
+        if parent_key:
+            full_key = parent_key + constants.markers.Underscore + str(key)
+        else:
+            full_key = str(key)
+        # the value is itself a dictionary and thus must be flattened as well
+        if isinstance(value, dict):
+            flatten_nested_dictionary(value, flat_dictionary, full_key)
+        # the value is a plain value and can be stored under the flat key
+        else:
+            flat_dictionary[full_key] = value
+
+
+def create_commits_dataframe_from_rows(
+    commits_list: List[Dict[Any, Any]],
+) -> pandas.DataFrame:
+    """Create a DataFrame out of a list of row dictionaries of commit message data."""
     # Since the commits list of dictionaries contains dictionaries that are
-    # nested in their structure, they must be normalized and then stored
+    # nested in their structure, they must be flattened and then stored
     # inside of a Pandas DataFrame. That results in variables with longer,
-    # hyphenated names that arise due to the flattening of nested dictionaries
-    total_commits_dataframe = pandas.json_normalize(
-        commits_list, sep=constants.markers.Underscore
-    )
+    # hyphenated names that arise due to the flattening of nested dictionaries.
+    # A direct Python pass over the shallow nesting of the commit data is
+    # substantially faster than the generic json_normalize function in Pandas.
+    # There are no rows of commit data, which is common for repositories that
+    # never ran a workflow, so immediately return an empty DataFrame
+    if not commits_list:
+        return pandas.DataFrame()
+    flat_commits_list: List[Dict[str, Any]] = []
+    for commit_dictionary in commits_list:
+        flat_commit_dictionary: Dict[str, Any] = {}
+        flatten_nested_dictionary(
+            commit_dictionary, flat_commit_dictionary, constants.markers.Nothing
+        )
+        flat_commits_list.append(flat_commit_dictionary)
+    total_commits_dataframe = pandas.DataFrame(flat_commits_list)
     return total_commits_dataframe
 
 
+def create_commits_dataframe(
+    organization: str,
+    repo: str,
+    repo_url: str,
+    github_api_url: str,
+    workflows_dictionary_list: List[Dict[Any, Any]],
+) -> pandas.DataFrame:
+    """Create a DataFrame of all the relevant commit message data."""
+    # extract the list of row dictionaries for this repository and then
+    # create the DataFrame for it in a single construction step
+    commits_list = create_commit_rows(
+        organization,
+        repo,
+        repo_url,
+        github_api_url,
+        workflows_dictionary_list,
+    )
+    return create_commits_dataframe_from_rows(commits_list)
+
+
 def create_workflow_record_count_dictionary(
     organization: str,
     repo: str,
     repo_url: str,
     github_api_url: str,
     workflows_dictionary_list: List[Dict[Any, Any]],
+    workflows_count_for_repo: Union[int, None] = None,
 ) -> Dict[str, Union[str, int]]:
     """Create a dictionary of all the counts of records returned for a GitHub project's workflows."""
     # create the empty dictionary that will store the relevant meta-data and the record count
     workflow_count_dictionary: Dict[str, Union[str, int]] = {}
-    # count the individual builds for a given GitHub repository's workflows
-    workflows_count_for_repo = count_individual_builds(workflows_dictionary_list)
+    # count the individual builds for a given GitHub repository's workflows;
+    # a caller that already performed the count can provide it directly
+    if workflows_count_for_repo is None:
+        workflows_count_for_repo = count_individual_builds(workflows_dictionary_list)
     # store all of the meta-data about this project:
     # --> GitHub organization name
     # --> GitHub repository name
@@ -190,9 +382,9 @@ def create_workflow_record_count_dictionary(
     workflow_count_dictionary[constants.workflow.Repo_Url] = str(repo_url)
     workflow_count_dictionary[constants.workflow.Actions_Url] = str(github_api_url)
     # store the count of all the workflow records for this repository
-    workflow_count_dictionary[
-        constants.workflow.Workflow_Build_Count
-    ] = workflows_count_for_repo
+    workflow_count_dictionary[constants.workflow.Workflow_Build_Count] = (
+        workflows_count_for_repo
+    )
     return workflow_count_dictionary
 
 
@@ -205,10 +397,12 @@ def extract_repo_urls_list(repos_dataframe: pandas.DataFrame) -> List[Union[str,
     if constants.data.Url in repos_dataframe.columns:
         # extract the data in the "url" column from the entire DataFrame
         url_column_series = repos_dataframe[constants.data.Url]
-        # convert the series arising from the "url" column to a list
+        # convert the series arising from the "url" column to a list; note
+        # that tolist already returns a fresh list and thus the result does
+        # not need to be copied into another list before it is returned
         if url_column_series is not None:
             url_column_list = url_column_series.tolist()
-    return list(url_column_list)
+    return url_column_list
 
 
 def merge_repo_urls_with_count_data(
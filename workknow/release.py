@@ -1,7 +1,11 @@
 """Upload results data as a release to a GitHub repository."""
 
 from pathlib import Path
+from typing import Union
 
+import base64
+import functools
+import hashlib
 import logging
 import sys
 
@@ -13,12 +17,24 @@ from rich.progress import TimeElapsedColumn
 from github import Github
 from github import GithubException
 from github import InputGitAuthor
+from github import InputGitTreeElement
 
 from workknow import configure
 from workknow import constants
 from workknow import request
 
 
+@functools.lru_cache(maxsize=8)
+def get_github_repository(github_access_token: str, github_repository_name: str):
+    """Authenticate to the GitHub API and retrieve the named repository."""
+    # both the authentication and the repository retrieval cost at least one
+    # round-trip to the GitHub API; since neither the token nor the details
+    # of the repository change during a run of the program, the Repository
+    # instance is memoized so that repeated uploads in one session reuse it
+    github = Github(github_access_token)
+    return github.get_repo(github_repository_name)
+
+
 def perform_github_upload(
     repo_url: str, organization: str, repository: str, semver: str, results_dir: Path
 ) -> None:
@@ -29,40 +45,49 @@ def perform_github_upload(
     console = configure.setup_console()
     # extract the github_access_token for use during upload process
     github_access_token = request.get_github_personal_access_token()
-    github = Github(github_access_token)
     # create the name of the GitHub repository name
     github_repository_name = organization + constants.github.Separator + repository
     logger.debug(github_repository_name)
     # create an instance of the Repository type through the use of PyGithub
-    github_repository = github.get_repo(github_repository_name)
-    # access the list of current files in the repository
-    all_files = []
-    contents = github_repository.get_contents("")
-    # continue while GitHub reports that there are still files or directories available
-    while contents:
-        # extract the contents of the current file
-        file_content = contents.pop(0)  # type: ignore
-        if file_content.type == "dir":
-            contents.extend(github_repository.get_contents(file_content.path))  # type: ignore
-        else:
-            file = file_content
-            all_files.append(
-                str(file).replace('ContentFile(path="', "").replace('")', "")
-            )
-    logger.debug(all_files)
-    results_directory_glob = results_dir.glob("**/*")
-    results_files = [x for x in results_directory_glob if x.is_file()]
-    results_files_contents = {}
-    for results_file in results_files:
-        logger.debug(results_file)
-        try:
-            results_file_contents = results_file.read_text()  # type: ignore
-        except UnicodeDecodeError:
-            results_file_contents = results_file.read_bytes()  # type: ignore
-        results_files_contents[str(results_file.name)] = results_file_contents
-    logger.debug(results_files)
-    results_files_names = [result_file.name for result_file in results_files]
+    github_repository = get_github_repository(
+        github_access_token, github_repository_name
+    )
+    # enumerate all of the files inside of the results directory and then
+    # create a mapping from the name of each results file to its path so
+    # that the blob creation can read each file at the moment it is needed;
+    # reading lazily means that the program only ever holds the contents
+    # of a single results file in memory instead of the entire directory
+    # a single traversal of the glob results builds both the ordered list of
+    # file names and the mapping from each name to its path, instead of
+    # materializing an intermediate list of paths and walking it repeatedly
+    results_files_paths = {}
+    results_files_names = []
+    for results_file in results_dir.rglob(constants.filesystem.Wildcard):
+        # skip the shelve-backed ETag cache that the download command stores
+        # in the results directory; the cache is a local binary artifact that
+        # holds complete workflow run payloads and it should never become a
+        # part of the tagged release of the results data (note that shelve
+        # can split the cache across several files that share its prefix)
+        if results_file.name.startswith(constants.filesystem.Etag_Cache):
+            continue
+        if results_file.is_file():
+            logger.debug(results_file)
+            results_files_paths[results_file.name] = results_file
+            results_files_names.append(results_file.name)
     logger.debug(results_files_names)
+    # look up the current commit on the main branch and the tree that it
+    # records; the SHA-1 hash of every existing blob in that tree makes it
+    # possible to detect a results file whose content did not change since
+    # the previous upload and to then skip the network transfer of its blob
+    branch_reference = github_repository.get_git_ref("heads/main")
+    base_commit_sha = branch_reference.object.sha
+    base_tree = github_repository.get_git_tree(base_commit_sha)
+    recursive_tree = github_repository.get_git_tree(base_commit_sha, recursive=True)
+    existing_blob_shas = {
+        tree_element.path: tree_element.sha
+        for tree_element in recursive_tree.tree
+        if tree_element.type == constants.github.Blob_Type
+    }
     with Progress(
         constants.progress.Task_Format,
         BarColumn(),
@@ -76,60 +101,50 @@ def perform_github_upload(
         "remaining",
     ) as progress:
         upload_pages_task = progress.add_task("Upload", total=len(results_files_names))
-        # create a default value for the last commit's SHA-1 value, which from
-        # the perspective of PyGitHub and the GitHub API is returned as a string
-        commit_sha = ""
-        # iterate through all of the files that need to be uploaded and EITHER
-        # --> Add them to the repository for the first time OR
-        # --> Update them in the repository if they already exist
-        # NOTE: This approach is going to create an "empty commit" with
-        # a message but no changed files when the file is "updated" but,
-        # in fact, there are no changes to upload to the repository
-        # Reference: https://github.com/PyGithub/PyGithub/issues/661
+        # upload the results files through the Git Data API instead of one
+        # create_file or update_file call for each file; the previous approach
+        # paid one HTTPS round-trip and created one commit per file, while
+        # this approach uploads every file as a blob, builds a single tree
+        # on top of the current one, and records a single commit. The blobs
+        # are created one at a time because the PyGithub requester funnels
+        # every call through one shared connection whose request state is not
+        # protected by a lock, so concurrent blob creation could interleave
+        # the payloads of different files and corrupt the committed tree.
+        # The single tree write also handles new and existing files uniformly
+        # and thus no crawl of the existing repository contents is needed
+        tree_elements = []
         for result_file_name in results_files_names:
-            # if the current result file is already found in the GitHub
-            # then it is important to get its contents and update them
-            if result_file_name in all_files:
-                # try to get the contents of the file, which will work
-                # correctly for text-based files but fail for all large
-                # BLOB files returned through the API larger than 1 MB
-                try:
-                    contents = github_repository.get_contents(result_file_name)
-                # attempt to read the file contents again since the previous
-                # approach did not work correctly and thus it might be a BLOB
-                except GithubException:
-                    contents = get_blob_content(
-                        github_repository, "main", result_file_name
-                    )
-                # the contents of the file *should* be accessible now in
-                # the variable called "contents" and thus it is okay to call update_file
-                update_dict = github_repository.update_file(
-                    result_file_name,
-                    "Update WorkKnow Data " + semver + " for " + result_file_name,
-                    results_files_contents[result_file_name],
-                    contents.sha,  # type: ignore
-                    branch="main",
-                )
-                logger.debug(result_file_name + " UPDATED")
-                # the returned update_dict contains a "commits" key that maps to a
-                # value that has a "sha" attribute; store this attribute in commit_sha
-                # because if this the last commit then this function needs the SHA-1
-                # hash to created a tagged release with a semver in the data repository
-                commit_sha = update_dict["commit"].sha
-            else:
-                # create the file since it is not currently inside the GitHub repository
-                create_dict = github_repository.create_file(
-                    result_file_name,
-                    "Add WorkKnow Data " + semver + " for " + result_file_name,
-                    results_files_contents[result_file_name],
+            # create the blob for this results file (or reuse the hash of an
+            # identical existing blob) and then pair the resulting SHA-1 hash
+            # with the name of its file inside of one element of the new tree
+            blob_sha = create_results_blob(
+                github_repository,
+                results_files_paths[result_file_name],
+                existing_blob_shas.get(result_file_name),
+            )
+            tree_elements.append(
+                InputGitTreeElement(
+                    path=result_file_name,
+                    mode=constants.github.Blob_Mode,
+                    type=constants.github.Blob_Type,
+                    sha=blob_sha,
                 )
-                # the returned update_dict contains a "commits" key that maps to a
-                # value that has a "sha" attribute; store this attribute in commit_sha
-                # because if this the last commit then this function needs the SHA-1
-                # hash to created a tagged release with a semver in the data repository
-                commit_sha = create_dict["commit"].sha
-                logger.debug(result_file_name + " CREATED")
+            )
+            logger.debug(result_file_name + " UPLOADED")
             progress.update(upload_pages_task, advance=1)
+        # build one new tree on top of the tree of the current commit on the
+        # main branch and then record one commit that contains every results
+        # file; finally, advance the branch reference to the new commit
+        new_tree = github_repository.create_git_tree(tree_elements, base_tree)
+        parent_commit = github_repository.get_git_commit(base_commit_sha)
+        new_commit = github_repository.create_git_commit(
+            "Add WorkKnow Data " + semver, new_tree, [parent_commit]
+        )
+        branch_reference.edit(new_commit.sha)
+        # store the SHA-1 hash of the single created commit because this
+        # function needs it to create a tagged release with a semver in the
+        # data repository after the upload of all of the files is complete
+        commit_sha = new_commit.sha
     # create a GitHub author for use in creating the tagged release of the repository
     # note that the date for the InputGitAuthor was extracted from this web site:
     # https://docs.github.com/en/rest/reference/git#tags
@@ -181,18 +196,33 @@ def perform_github_upload(
         sys.exit(1)
 
 
-def get_blob_content(repo, branch, path_name):
-    """Extract the blob content's using an extracted SHA-1 hash."""
-    # Reference:
-    # https://github.com/PyGithub/PyGithub/issues/661
-    # get the branch reference for the Github instance in repo
-    ref = repo.get_git_ref(f"heads/{branch}")
-    # get the tree of the entire Git repository
-    tree = repo.get_git_tree(ref.object.sha, recursive="/" in path_name).tree
-    # look for the path in the tree
-    sha = [x.sha for x in tree if x.path == path_name]
-    if not sha:
-        # the SHA hash was not found, so return None
-        return None
-    # return the contents of the BLOB based on the hash value
-    return repo.get_git_blob(sha[0])
+def create_results_blob(
+    github_repository,
+    results_file_path: Path,
+    existing_blob_sha: Union[str, None] = None,
+) -> str:
+    """Create a Git blob for the provided results file and return its SHA-1 hash."""
+    # read the raw bytes of the results file at the moment of its upload and
+    # transmit them with a base64 encoding; since the GitHub API ultimately
+    # stores every blob as base64-transmitted bytes, this single code path
+    # works uniformly for both text-based files like CSVs and binary files
+    # like zip archives, with no need to attempt a text decode that can fail
+    results_file_bytes = results_file_path.read_bytes()
+    # compute the SHA-1 hash that Git itself would assign to a blob with
+    # this content; when it matches the hash of the blob already recorded
+    # in the tree of the main branch the content of this results file did
+    # not change since the previous upload and the network transfer of the
+    # blob can be skipped entirely by reusing the hash of the existing blob
+    if existing_blob_sha is not None:
+        local_blob_sha = hashlib.sha1(
+            b"blob %d\0" % len(results_file_bytes) + results_file_bytes
+        ).hexdigest()
+        if local_blob_sha == existing_blob_sha:
+            return existing_blob_sha
+    results_file_contents = base64.b64encode(results_file_bytes).decode(
+        constants.github.Ascii_Encoding
+    )
+    blob = github_repository.create_git_blob(
+        results_file_contents, constants.github.Base64_Encoding
+    )
+    return blob.sha
@@ -1,13 +1,17 @@
 """Use the GitHub REST API to access information about GitHub Action Workflows."""
 
-from urllib import parse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import datetime
+import functools
 import logging
 import os
-import sys
+import random
+import re
 import time
 
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Tuple
@@ -22,8 +26,71 @@ from rich.progress import TimeElapsedColumn
 import pytz
 import requests
 
+from workknow import cache
 from workknow import constants
 
+# attempt to import the optional orjson package; when it is available the
+# JSON bodies of the responses from the GitHub API are parsed by orjson's
+# fast C implementation instead of the standard library parser that the
+# requests package uses inside of the json method on a response
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# attempt to import the optional brotli package; when it is available the
+# GitHub API is asked to compress its responses with brotli, which shrinks
+# the highly compressible workflow runs JSON beyond what gzip achieves.
+# The header is only advertised when the package exists because urllib3
+# can only decode a brotli response body with the help of that package
+try:
+    import brotli  # type: ignore # noqa: F401 pylint: disable=unused-import
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# create a single module-level session so that every request to the GitHub
+# API reuses a pooled keep-alive connection; this avoids performing a new
+# TCP and TLS handshake for every page of every repository, which is the
+# dominant fixed cost when downloading many small paginated responses.
+# A fully asynchronous download of multiple repositories at once would
+# conflict with the sequential rate-limit checking that WorkKnow performs,
+# so connection reuse is the appropriate way to reduce the network overhead
+session = requests.Session()
+# mount an adapter with an explicitly sized connection pool so that every
+# worker thread that downloads a page (see request_json_from_github) can
+# hold its own pooled keep-alive connection; the default pool would start
+# discarding connections once the number of threads exceeded its size.
+# Note that the adapter deliberately does not configure its own retries
+# because this module implements the exponential back-off retry procedure
+session_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=constants.workknow.Session_Pool_Size,
+    pool_maxsize=constants.workknow.Session_Pool_Size,
+)
+session.mount(constants.workknow.Https, session_adapter)
+# advertise brotli compression on every request when the optional brotli
+# package is installed; the workflow runs JSON compresses roughly an order
+# of magnitude and the decompression happens inside of the C extension
+if BROTLI_AVAILABLE:
+    session.headers[constants.github.Accept_Encoding] = (
+        constants.github.Accept_Encoding_Brotli
+    )
+
+# match the page query parameter inside of the URL for the last page that
+# the GitHub API reports in the Link header of every paginated response;
+# compiling the pattern once at import time means that extracting the last
+# page index never needs to split and parse the complete URL
+PAGE_NUMBER_REGEX = re.compile(r"[?&]page=(\d+)")
+
+# keep a local record of the rate limit details that the GitHub API reports
+# in the X-RateLimit headers of every data response; consulting this record
+# instead of the dedicated rate limit endpoint avoids paying an extra HTTP
+# round-trip for a rate limit check after every downloaded repository
+_rate_limit_state: Dict[str, int] = {}
+
 # Sample of the JSON file returned by the request:
 
 # {
@@ -38,46 +105,76 @@ from workknow import constants
 # }
 
 
+@functools.lru_cache(maxsize=1)
 def get_github_personal_access_token() -> str:
     """Retrieve the GitHub personal access token from the environment."""
     # extract the GITHUB_ACCESS_TOKEN environment variable; note that this
-    # only works because of the fact that load_dotenv was previously called
-    github_personal_access_token = os.getenv(
+    # only works because of the fact that load_dotenv was previously called.
+    # Since the environment does not change after load_dotenv runs, the
+    # lookup is memoized; this function is otherwise called before every
+    # request that WorkKnow makes to the GitHub API, including every page
+    return os.getenv(
         constants.environment.Github_Access_Token, default=constants.markers.Nothing
     )
-    return github_personal_access_token
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_timezone() -> str:
     """Retrieve the user's local time zone from the environment."""
-    # extract the GITHUB_ACCESS_TOKEN environment variable; note that this
-    # only works because of the fact that load_dotenv was previously called
-    local_timezone = os.getenv(constants.environment.Timezone, default="")
-    return local_timezone
+    # extract the LOCAL_TIMEZONE environment variable; note that this
+    # only works because of the fact that load_dotenv was previously called.
+    # As with the access token, the environment variable cannot change
+    # during a run of the program and thus the lookup is memoized
+    return os.getenv(constants.environment.Timezone, default="")
+
+
+def parse_response_json(response):
+    """Parse the JSON body of a response, using orjson when it is available."""
+    # the orjson package is available so parse the raw bytes of the response
+    # body directly, which avoids both the slower standard library parser
+    # and the encoding detection performed inside of the json method
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    # the orjson package is not available so use the standard approach
+    return response.json()
+
+
+class GitHubNoDataError(RuntimeError):
+    """Indicate that a response from the GitHub API did not contain workflow runs data."""
 
 
-def get_workflow_runs(json_responses, console):
+def get_workflow_runs(json_responses):
     """Get the list of workflow run information for a JSON-derived dictionary."""
     # this dictionary has a key called "workflow_runs" that has as its value a
     # list of dictionaries, one for each run inside of GitHub Actions. This
-    # will return the list so that it can be stored and analyzed.
-    if constants.github.Workflow_Runs in json_responses:
-        return json_responses[constants.github.Workflow_Runs]
+    # will return the list so that it can be stored and analyzed. Note that
+    # the single get performs one hash lookup instead of the membership test
+    # followed by a key access, which matters because this function runs for
+    # every downloaded page of every repository
+    workflow_runs = json_responses.get(constants.github.Workflow_Runs)
+    if workflow_runs is not None:
+        return workflow_runs
     logger = logging.getLogger(constants.logging.Rich)
     logger.error(json_responses)
     # the workflow runs data is not available and this means that the GitHub REST
     # API did not return any viable data, likely due to the fact that the program
-    # is rate limited. It can no longer proceed without error, so exit.
+    # is rate limited or the repository does not exist. Raise a typed error so
+    # that a caller downloading the history of many repositories can display a
+    # diagnostic message, skip this repository, and then continue with the rest
+    raise GitHubNoDataError(str(json_responses))
+
+
+def display_no_workflow_data_diagnostic(console: Console) -> None:
+    """Display a diagnostic message to explain that the GitHub API provided no workflow data."""
     console.print()
     console.print(":grimacing_face: No workflow data provided by the GitHub API")
     console.print(
         "WorkKnow may be rate limited or the repository may not exist"
         + constants.markers.Newline
         + constants.markers.Newline
-        + ":sad_but_relieved_face: Exiting now!"
+        + ":sad_but_relieved_face: Moving to the next repository!"
     )
     console.print()
-    sys.exit(1)
 
 
 def get_rate_limit_details():
@@ -93,51 +190,85 @@ def get_rate_limit_details():
     # --> provided GitHub URL that accesses a project's GitHub Actions log
     # --> the parameters that currently specify the page limit and will specify the page
     # --> the GitHub authentication information with the personal access token
-    response = requests.get(github_api_url, auth=github_authentication)
-    response_json_dict = response.json()
-    logger.debug(response_json_dict)
+    response = session.get(github_api_url, auth=github_authentication)
+    response_json_dict = parse_response_json(response)
+    # the guard avoids creating the textual version of the complete parsed
+    # rate limit document when debugging output is not going to be displayed
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(response_json_dict)
     return response_json_dict[constants.rate.Resources][constants.rate.Core]
 
 
-def utc_to_time(naive, timezone):
-    """Convert a UTC time zone that is naive to a locally situation timezone."""
-    return naive.replace(tzinfo=pytz.utc).astimezone(pytz.timezone(timezone))
-
-
-def get_rate_limit_wait_time_and_wait(rate_limit_dict: Dict[str, int]) -> int:
+def update_rate_limit_state(response) -> None:
+    """Record the rate limit details transmitted in the headers of a response."""
+    # every data response from the GitHub API reports the remaining request
+    # budget and the reset time in its headers; recording them makes a
+    # separate request to the rate limit endpoint almost always unnecessary
+    remaining = response.headers.get(constants.rate.Remaining_Header)
+    reset = response.headers.get(constants.rate.Reset_Header)
+    if remaining is not None and reset is not None:
+        _rate_limit_state[constants.rate.Remaining] = int(remaining)
+        _rate_limit_state[constants.rate.Reset] = int(reset)
+
+
+def check_local_rate_state(
+    threshold: int = constants.rate.Refresh_Threshold,
+) -> None:
+    """Check the locally recorded rate limit budget, only contacting the endpoint when the budget is low."""
+    remaining = _rate_limit_state.get(constants.rate.Remaining)
+    # the locally recorded budget is either not yet known or is getting low;
+    # confirm the budget with the authoritative rate limit endpoint and, when
+    # the program is in danger of being rate limited, sleep until the reset
+    if remaining is None or remaining < threshold:
+        rate_limit_dict = get_rate_limit_details()
+        _rate_limit_state[constants.rate.Remaining] = rate_limit_dict[
+            constants.rate.Remaining
+        ]
+        _rate_limit_state[constants.rate.Reset] = rate_limit_dict[constants.rate.Reset]
+        get_rate_limit_wait_time_and_wait(rate_limit_dict)
+
+
+def get_rate_limit_wait_time_and_wait(rate_limit_dict: Dict[str, int]) -> float:
     """Determine the amount of time needed for waiting because of rate limit."""
+    # the remaining request budget is still healthy and thus there is no
+    # need to wait at all; returning immediately avoids performing any of
+    # the timezone and datetime work on this, the common, branch of the
+    # function that runs after nearly every downloaded repository
+    if rate_limit_dict[constants.rate.Remaining] >= constants.rate.Threshold:
+        return 0
     console = Console()
     # initialize the logging subsystem
     logger = logging.getLogger(constants.logging.Rich)
     # extract reset time from the response from the GitHub API
     reset_time_in_utc_epoch_seconds = rate_limit_dict[constants.rate.Reset]
-    # extract the local time zone to help with display of debugging information
+    # extract the local time zone to help with display of diagnostic information
     local_time_zone = get_local_timezone()
     current_timezone = pytz.timezone(local_time_zone)
-    # convert the epoch seconds to a UTC-zoned datetime
-    reset_datetime = datetime.datetime.utcfromtimestamp(reset_time_in_utc_epoch_seconds)
-    # convert the UTC-zoned datetime to a local-zone datetime
-    reset_datetime_local = utc_to_time(reset_datetime, current_timezone.zone)
+    # convert the epoch seconds of the reset directly to a datetime in the
+    # local time zone for display in the diagnostic message; note that this
+    # single conversion replaces the previous chain of naive-UTC, localized
+    # UTC, and local-zone datetimes that allocated three datetime objects
+    reset_datetime_local = datetime.datetime.fromtimestamp(
+        reset_time_in_utc_epoch_seconds, current_timezone
+    )
     # display debugging information
     logger.debug(reset_time_in_utc_epoch_seconds)
-    logger.debug(reset_datetime)
     logger.debug(reset_datetime_local)
-    # calculate the number of seconds needed to sleep until the reset happens for GitHub's API
-    current_time = datetime.datetime.now(datetime.timezone.utc)
-    current_time_utc_timestamp = current_time.timestamp()
-    sleep_time_seconds = reset_time_in_utc_epoch_seconds - current_time_utc_timestamp
-    logger.debug(current_time_utc_timestamp)
+    # calculate the number of seconds needed to sleep until the reset happens
+    # for GitHub's API; since both the reset moment and the current moment
+    # are available as epoch seconds, the duration is a single subtraction
+    sleep_time_seconds = reset_time_in_utc_epoch_seconds - time.time()
     logger.debug(sleep_time_seconds)
     # the program is in danger of being rate limited, which will cause a crash, and
-    # thus it is better to sleep for the remainder of the period until the reset
-    total_sleep_time_elapsed = sleep_time_seconds + constants.rate.Extra_Seconds
-    if rate_limit_dict[constants.rate.Remaining] < constants.rate.Threshold:
-        logger.debug(sleep_time_seconds)
-        console.print(
-            f":sleeping_face: Sleeping for {sleep_time_seconds} seconds while waiting for the GitHub API to reset the rate limits"
-        )
-        console.print(f"WorkKnow will continue to sleep until {reset_datetime_local}")
-        time.sleep(total_sleep_time_elapsed)
+    # thus it is better to sleep for the remainder of the period until the reset;
+    # when the reset moment already passed while the program was working, only
+    # the small padding is slept instead of a negative or stale remainder
+    total_sleep_time_elapsed = max(sleep_time_seconds, 0) + constants.rate.Extra_Seconds
+    console.print(
+        f":sleeping_face: Sleeping for {sleep_time_seconds} seconds while waiting for the GitHub API to reset the rate limits"
+    )
+    console.print(f"WorkKnow will continue to sleep until {reset_datetime_local}")
+    time.sleep(total_sleep_time_elapsed)
     return total_sleep_time_elapsed
 
 
@@ -146,31 +277,45 @@ def extract_last_page(response_links_dict: Dict[str, Dict[str, str]]) -> int:
     logger = logging.getLogger(constants.logging.Rich)
     last_page = 0
     # the "last" key is inside of the response_links_dict and this means
-    # that GitHub's API has revealed the last page; now extract it
+    # that GitHub's API has revealed the last page; now extract it by
+    # matching the page query parameter directly with a precompiled regular
+    # expression, which avoids splitting and re-parsing the entire URL just
+    # to recover a single integer out of its query string
     if constants.github.Last in response_links_dict:
         last_dict = response_links_dict[constants.github.Last]
         last_url = last_dict[constants.github.Url]
         logger.debug(last_url)
-        query_dict = dict(parse.parse_qsl(parse.urlsplit(last_url).query))
-        logger.debug(query_dict)
-        last_page = int(query_dict[constants.github.Page])
+        page_match = PAGE_NUMBER_REGEX.search(last_url)
+        if page_match is not None:
+            last_page = int(page_match.group(1))
     return last_page
 
 
-def calculate_backoff_sleep_time(backoff_factor: int, number_of_retries: int) -> int:
-    """Calculate the amount of sleep required based on an exponential back-off calculation."""
+def calculate_backoff_sleep_time(backoff_factor: int, number_of_retries: int) -> float:
+    """Calculate the amount of sleep required based on a jittered exponential back-off calculation."""
     # Reference:
     # https://findwork.dev/blog/advanced-usage-python-requests-timeouts-retries-hooks/
     # Note that the implementation in this module does not use the sophisticated
-    # adapters that might ultimately make it easier to perform the back-off procedure
-    return backoff_factor * (2 ** (number_of_retries - 1))
+    # adapters that might ultimately make it easier to perform the back-off procedure.
+    # The exponential ceiling doubles with every retry up to a maximum cap and the
+    # actual sleep is drawn uniformly between zero and that ceiling; this full jitter
+    # spreads out the instants at which concurrent downloads retry so that they do
+    # not all return to the GitHub API at the same moment after a shared failure
+    backoff_ceiling = min(
+        constants.github.Maximum_Backoff_Seconds,
+        backoff_factor * (2 ** (number_of_retries - 1)),
+    )
+    return random.uniform(0, backoff_ceiling)
+
+
+# the two human-readable answers, positioned so that indexing the tuple
+# with a boolean value selects the matching answer without any branching
+HUMAN_READABLE_ANSWERS = ("No", "Yes")
 
 
 def human_readable_boolean(answer: bool) -> str:
     """Produce a human-readable Yes or No for a boolean value of True or False."""
-    if answer:
-        return "Yes"
-    return "No"
+    return HUMAN_READABLE_ANSWERS[bool(answer)]
 
 
 def request_with_caution(
@@ -179,39 +324,89 @@ def request_with_caution(
     github_authentication,
     progress,
     maximum_retries: int = constants.github.Maximum_Request_Retries,
-) -> Tuple[bool, int, int, Union[None, requests.Response]]:
-    """Request data from the GitHub API in a cautious fashion, checking for exceptions and waiting when needed."""
+    github_headers=None,
+) -> Tuple[bool, int, float, Union[None, requests.Response]]:
+    """Request data from the GitHub API in a cautious fashion, retrying on exceptions and error codes with back-off."""
     # use requests to access the GitHub API with:
     # --> provided GitHub URL that accesses a project's GitHub Actions log
     # --> the parameters that currently specify the page limit and will specify the page
     # --> the GitHub authentication information with the personal access token
-    # assume that there is no valid response and extract one if possible
+    # assume that there is no successful response and extract one if possible
     response = None
-    valid_response = False
+    successful_response = False
     # keep track of the number of requests for diagnostic report back
     request_retries_count = 1
-    # keep track of whether or not any sleeping took place during retries
-    running_sleep_time_in_seconds = 0
-    # the first sleep should be the default about of sleeping
-    sleep_time_in_seconds = constants.github.Wait_In_Seconds
-    # allow a special diagnostic message to appear on first exception
-    first_exception = True
-    # continue performing a retry as long as there is no valid response and
-    # this process has not exceeded the value number of retries
-    while not valid_response and request_retries_count <= maximum_retries:
-        # attempt to extract a response which checking for an exception
+    # keep track of whether or not any sleeping took place during retries;
+    # the total is a float because every back-off sleep is a jittered draw
+    running_sleep_time_in_seconds = 0.0
+    # allow a special diagnostic message to appear on the first failure
+    first_failure = True
+    # indicate that an attempt at a retry has not yet happened
+    attempted_retries = False
+    # continue performing a retry as long as there is no successful response
+    # and this process has not exceeded the maximum number of retries; note
+    # that a single loop covers both a request that raises an exception and
+    # a request that completes with an error status code like a 502, so a
+    # failing URL only ever sleeps through one exponential back-off schedule
+    while not successful_response and request_retries_count <= maximum_retries:
+        # attempt to extract a response while checking for an exception
         try:
-            response = requests.get(
-                github_api_url, params=github_params, auth=github_authentication
+            response = session.get(
+                github_api_url,
+                params=github_params,
+                auth=github_authentication,
+                headers=github_headers,
             )
-            # the response was valid because of the fact that the previous line
-            # of code did not trigger an exception and jump to the except block
-            valid_response = True
+            # record the rate limit details reported in the response headers
+            update_rate_limit_state(response)
+            # the response completed with a status code that indicates that
+            # valid data is available and thus no retry procedure is needed
+            if is_successful_response(response.status_code):
+                successful_response = True
+            # the response completed with an error status code like a 502
+            # and thus the request must be retried after a back-off sleep
+            else:
+                # the first failure merits a diagnostic message about the
+                # standard progress bar to indicate the failure and retries
+                if first_failure:
+                    progress.console.print()
+                    progress.console.print(
+                        f":grimacing_face: Unable to access GitHub API at {github_api_url} due to error code {response.status_code}"
+                    )
+                    progress.console.print(
+                        f"{constants.markers.Tab}...Will attempt {maximum_retries} retries"
+                    )
+                    first_failure = False
+                attempted_retries = True
+                # perform an exponential back-off calculation to determine how long to sleep
+                sleep_time_in_seconds = calculate_backoff_sleep_time(
+                    constants.github.Wait_In_Seconds, request_retries_count
+                )
+                # the GitHub API attaches a Retry-After header to the responses
+                # that it sends when a secondary rate limit was hit; honoring
+                # the requested wait avoids burning retries that are guaranteed
+                # to fail before the stated number of seconds has elapsed
+                retry_after = response.headers.get(constants.github.Retry_After)
+                if retry_after is not None:
+                    sleep_time_in_seconds = max(sleep_time_in_seconds, int(retry_after))
+                progress.console.print(
+                    f"{constants.markers.Tab}{constants.markers.Tab}...Waiting for {sleep_time_in_seconds:.2f} second(s)"
+                )
+                # the ceiling schedule for the default starting sleep is:
+                # 1, 2, 4, 8, 16, 32, 60, 60, 60, [...] seconds and the
+                # actual sleep is a jittered draw below the current ceiling
+                time.sleep(sleep_time_in_seconds)
+                # keep track of the total amount of time in sleeping for
+                # diagnostic and testing purposes
+                running_sleep_time_in_seconds = (
+                    running_sleep_time_in_seconds + sleep_time_in_seconds
+                )
+                request_retries_count = request_retries_count + 1
         except requests.exceptions.RequestException as request_exception:
-            # there was an exception and, in fact, it was the first exception
+            # there was an exception and, in fact, it was the first failure
             # and thus WorkKnow must display a diagnostic message about the
             # standard progress bar to indicate the failure and retries
-            if first_exception:
+            if first_failure:
                 progress.console.print()
                 progress.console.print(
                     f":grimacing_face: Unable to access GitHub API at {github_api_url} due to exception {request_exception}"
@@ -219,18 +414,20 @@ def request_with_caution(
                 progress.console.print(
                     f"{constants.markers.Tab}...Will attempt {maximum_retries} retries"
                 )
-                # if any follow-on exceptions occur then they will be, by definition,
-                # not the first exception and thus this diagnostic output is not needed
-                first_exception = False
+                # if any follow-on failures occur then they will be, by definition,
+                # not the first failure and thus this diagnostic output is not needed
+                first_failure = False
+            attempted_retries = True
             # perform an exponential back-off calculation to determine how long to sleep
             sleep_time_in_seconds = calculate_backoff_sleep_time(
                 constants.github.Wait_In_Seconds, request_retries_count
             )
             progress.console.print(
-                f"{constants.markers.Tab}{constants.markers.Tab}...Waiting for {sleep_time_in_seconds} second(s)"
+                f"{constants.markers.Tab}{constants.markers.Tab}...Waiting for {sleep_time_in_seconds:.2f} second(s)"
             )
-            # the sleep schedule for the default starting sleep is:
-            # 1, 2, 4, 8, 16, 32, 64, 128, 256, [...] seconds
+            # the ceiling schedule for the default starting sleep is:
+            # 1, 2, 4, 8, 16, 32, 60, 60, 60, [...] seconds and the
+            # actual sleep is a jittered draw below the current ceiling
             time.sleep(sleep_time_in_seconds)
             # keep track of the total amount of time in sleeping for
             # diagnostic and testing purposes
@@ -238,139 +435,87 @@ def request_with_caution(
                 running_sleep_time_in_seconds + sleep_time_in_seconds
             )
             request_retries_count = request_retries_count + 1
-    # assume that the response is not valid and prove otherwise
-    valid = False
-    # if the response object is not None then it probably has data that was returned
-    # from the GitHub API and thus it is safe to return it to the calling function
-    if response is not None:
-        valid = True
-    # note that this returns request_retries_count - 1 because this variable is always
-    # incremented at the end of the loop even though that round did not take place yet
-    return (valid, request_retries_count - 1, running_sleep_time_in_seconds, response)
-
-
-def request_json_from_github_with_caution(
-    github_api_url: str,
-    github_params,
-    github_authentication,
-    progress,
-    maximum_retries: int = constants.github.Maximum_Request_Retries,
-) -> Tuple[bool, int, int, Union[requests.Response, None]]:
-    """Request data from the GitHub API in a cautious fashion, checking error codes and waiting when needed."""
-    # use requests to access the GitHub API with:
-    # --> provided GitHub URL that accesses a project's GitHub Actions log
-    # --> the parameters that currently specify the page limit and will specify the page
-    # --> the GitHub authentication information with the personal access token
-    # response = requests.get(
-    #     github_api_url, params=github_params, auth=github_authentication
-    # )
-    (valid, request_retries_count, request_sleep_time, response) = request_with_caution(
-        github_api_url, github_params, github_authentication, progress, maximum_retries
-    )
-    if not valid:
-        return (valid, request_retries_count, request_sleep_time, None)
-    # start the retry count at 1 so that the first calculation of an exponential
-    # back-off works as expected; all retry operations will use <= to the maximum
-    # so as to ensure that the number of retries goes to the maximum value
-    response_retries_count = 1
-    # extract the status_code from the response provided by the GitHub server;
-    # in my experience with using WorkKnow, these are two common status codes:
-    # 200: everything worked and JSON response is available
-    # 502: error on the server and a error-message JSON contains no data
-    current_response_status_code = response.status_code  # type: ignore
-    # indicate that an attempt at a retry has not yet happened
-    attempted_retries = False
-    running_sleep_time_in_seconds = 0
-    # the response code indicates that there was no success for this
-    # interaction with the GitHub API and thus we must retry in an
-    # exponential back-off fashion up to a maximum number of retries
-    if response.status_code != constants.github.Success_Response:  # type: ignore
-        progress.console.print()
-        progress.console.print(
-            f":grimacing_face: Unable to access GitHub API at {github_api_url} due to error code {current_response_status_code}"
-        )
-        # at least one retry is going to happen, so set this
-        # to True to indicate that this took place, ensuring that
-        # no diagnostic output appears above the progress bar unless needed
-        attempted_retries = True
-        progress.console.print(
-            f"{constants.markers.Tab}...Will attempt {maximum_retries} retries"
-        )
-        # keep retrying as long as:
-        # --> the loop has not retried the maximum number of times
-        # --> the status code from the GitHub server is not a success response
-        sleep_time_in_seconds = constants.github.Wait_In_Seconds
-        while (
-            current_response_status_code != constants.github.Success_Response
-            and response_retries_count <= maximum_retries
-        ):
-            # perform an exponential back-off calculation to determine how long to sleep
-            sleep_time_in_seconds = calculate_backoff_sleep_time(
-                constants.github.Wait_In_Seconds, response_retries_count
-            )
-            # sleep for the calculated period of time
-            progress.console.print(
-                f"{constants.markers.Tab}{constants.markers.Tab}...Waiting for {sleep_time_in_seconds} second(s)"
-            )
-            # the sleep schedule for the default starting sleep is:
-            # 1, 2, 4, 8, 16, 32, 64, 128, 256, [...] seconds
-            time.sleep(sleep_time_in_seconds)
-            # keep track of the total amount of time in sleeping for
-            # diagnostic and testing purposes
-            running_sleep_time_in_seconds = (
-                running_sleep_time_in_seconds + sleep_time_in_seconds
-            )
-            progress.console.print(
-                f"{constants.markers.Tab}{constants.markers.Tab}...Attempt {response_retries_count} to access GitHub API at {github_api_url}"
-            )
-            # response = requests.get(
-            #     github_api_url, params=github_params, auth=github_authentication
-            # )
-            (
-                valid,
-                request_retries_count,
-                request_sleep_time,
-                response,
-            ) = request_with_caution(
-                github_api_url,
-                github_params,
-                github_authentication,
-                progress,
-                maximum_retries,
-            )
-            if not valid:
-                return (valid, request_retries_count, request_sleep_time, None)
-            # extract the current response code for check in next iteration of loop
-            current_response_status_code = response.status_code  # type: ignore
-            # indicate that another retry has taken place
-            response_retries_count = response_retries_count + 1
-    # since the loop will terminate as soon as there is a successful response code,
-    # the last response code is the one that can be checked for a successful response
-    # when the return code is not indicative of success, then the returned data is not valid
-    if current_response_status_code != constants.github.Success_Response:
-        valid = False
-    # the response code is success and thus the returned data is valid
-    else:
-        valid = True
+    # the returned data is only valid when the final attempt produced a
+    # response whose status code indicates that valid data is available
+    valid = successful_response
     # if this function attempted some retries, then display diagnostic information about the number of retries
     # and whether or not those retries resulted in the collection of valid data. Note that the diagnostic and
-    # the return value both use (response_retries_count-1) because the loop will have incremented this value one
-    # time too many and thus there is a need to subtract one in order to get the accurate count
+    # the return value both use (request_retries_count - 1) because this variable is always incremented at the
+    # end of a failing round even though the next round may not take place
     if attempted_retries:
         progress.console.print(
-            f"{constants.markers.Tab}...After {response_retries_count - 1} retries, did the retry procedure work correctly? {human_readable_boolean(valid)}"
+            f"{constants.markers.Tab}...After {request_retries_count - 1} retries, did the retry procedure work correctly? {human_readable_boolean(valid)}"
+        )
+    return (valid, request_retries_count - 1, running_sleep_time_in_seconds, response)
+
+
+def is_successful_response(status_code: int) -> bool:
+    """Determine whether a status code from the GitHub API indicates success."""
+    # both a standard success response and a not-modified response indicate
+    # that valid data is available, either in the body of the response or,
+    # for a not-modified response, inside of the on-disk cache of responses
+    return status_code in (
+        constants.github.Success_Response,
+        constants.github.Not_Modified_Response,
+    )
+
+
+def create_conditional_request_headers(
+    cache_file_name: Union[str, None], url_key: str
+) -> Union[Dict[str, str], None]:
+    """Create the headers that make a request conditional on a previously cached ETag."""
+    # the cache is not in use so there are no extra headers to transmit
+    if cache_file_name is None:
+        return None
+    # load the ETag for this URL from the cache and, when one exists, ask
+    # the GitHub API to only transmit data if it changed since that ETag
+    etag = cache.load_etag(cache_file_name, url_key)
+    if etag != constants.markers.Nothing:
+        return {constants.github.If_None_Match: etag}
+    return None
+
+
+def get_workflow_runs_with_cache(
+    response,
+    cache_file_name: Union[str, None],
+    url_key: str,
+) -> Tuple[List[Dict[Any, Any]], Dict[str, Dict[str, str]]]:
+    """Extract the workflow runs and links for a response, consulting the cache on a not-modified response."""
+    # the GitHub API indicated that the data for this URL did not change
+    # since it was last cached, so reuse the stored runs and links; note
+    # that a not-modified response contains no body that could be parsed
+    if (
+        cache_file_name is not None
+        and response.status_code == constants.github.Not_Modified_Response
+    ):
+        return cache.load_response_details(cache_file_name, url_key)
+    # the response contains fresh data, so extract the workflow runs from
+    # its JSON body and then store them in the cache alongside the ETag
+    workflow_runs = get_workflow_runs(parse_response_json(response))
+    response_links = response.links
+    if cache_file_name is not None:
+        etag = response.headers.get(constants.github.Etag, constants.markers.Nothing)
+        cache.store_response_details(
+            cache_file_name, url_key, etag, workflow_runs, response_links
         )
-    return (valid, response_retries_count - 1, running_sleep_time_in_seconds, response)
+    return (workflow_runs, response_links)
 
 
 def request_json_from_github(
     github_api_url: str,
     console: Console,
     maximum_retries=constants.github.Maximum_Request_Retries,
-) -> Tuple[bool, int, int, List]:
+    cache_dir: Union[Path, None] = None,
+) -> Tuple[bool, int, float, List]:
     """Request the JSON response from the GitHub API."""
     # initialize the logging subsystem
     logger = logging.getLogger(constants.logging.Rich)
+    # determine the name of the on-disk cache file when a cache directory
+    # was provided; the cache makes repeated downloads of an unchanged
+    # repository nearly free with respect to the GitHub API rate limit
+    cache_file_name = None
+    if cache_dir is not None:
+        cache_file_name = cache.create_cache_file_name(cache_dir)
     # access the person's GitHub personal access token so that
     # the use of the tool is not rapidly rate limited
     github_authentication = (constants.github.User, get_github_personal_access_token())
@@ -382,9 +527,9 @@ def request_json_from_github(
         constants.github.Per_Page: constants.github.Per_Page_Maximum,
     }
     initial_retry_count = 0
-    initial_sleep_time = 0
+    initial_sleep_time = 0.0
     complete_retry_count = 0
-    complete_sleep_time = 0
+    complete_sleep_time = 0.0
     # use a progress bar to designate the requesting of JSON data from
     # the GitHub API; this will be divided into two phases:
     # --> Phase 1: Initial download of the first page
@@ -403,72 +548,156 @@ def request_json_from_github(
     ) as progress:
         # perform the download of the first page, using the cautious approach
         download_first_page = progress.add_task("Initial Download", total=1)
+        # create the cache key for the first page of results and then create
+        # the conditional request headers out of any previously cached ETag
+        url_key = github_api_url + "?" + constants.github.Page + "=1"
+        github_headers = create_conditional_request_headers(cache_file_name, url_key)
         (
             valid,
             initial_retry_count,
             initial_sleep_time,
             response,
-        ) = request_json_from_github_with_caution(
+        ) = request_with_caution(
             github_api_url,
             github_params,
             github_authentication,
             progress,
             maximum_retries,
+            github_headers,
         )
         # since the goal is to only download a single page, advance the progress bar
         # for this task, thereby signalling completion of this stage
         progress.advance(download_first_page)
-        # create an empty list that can store all of the JSON responses for workflow runs
+        # create an empty list that can store all of the workflow runs from
+        # every page of the JSON responses in one flat list of dictionaries
         json_responses = []
         # the response from the GitHub API was valid, which means that it either returned
         # correctly the first time or, alternatively, waiting in an exponential back-off
         # fashion ultimately resulted in the download completing with success
         if valid:
-            # extract the JSON document (it is a dict) and then extract from that the workflow runs list;
-            # finally, append the list of workflow runs to the running list of response details
-            json_responses.append(get_workflow_runs(response.json(), console))  # type: ignore
-            logger.debug(response.headers)  # type: ignore
-            # pagination in GitHub Actions is 1-indexed (i.e., the first index is 1)
-            # and thus the next page that we will need to extract (if needed) is 2
-            page = constants.github.Page_Start
+            # extract the workflow runs list and the pagination links, either from
+            # the JSON document in the response or from the cache of responses;
+            # finally, append the list of workflow runs to the running list of
+            # response details. A response without workflow runs data means that
+            # this repository cannot be downloaded, so display the diagnostic
+            # message and mark the collected data as invalid instead of exiting,
+            # which lets a download of many repositories continue with the rest
+            try:
+                workflow_runs, response_links = get_workflow_runs_with_cache(
+                    response, cache_file_name, url_key
+                )
+            except GitHubNoDataError:
+                display_no_workflow_data_diagnostic(console)
+                valid = False
+                workflow_runs = []
+                response_links = {}
+            # extend the running list so that it stays flat, with one entry
+            # for each workflow run instead of one nested list for each page;
+            # the flat shape lets every consumer iterate and count the runs
+            # directly without a flattening pass over a list of page lists
+            json_responses.extend(workflow_runs)
+            # the guard avoids stringifying the case-insensitive headers
+            # dictionary when debugging output is not going to be displayed
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(response.headers)  # type: ignore
             # check if the program is about to exceed GitHub's rate limit and then
-            # sleep the program until the reset time has elapsed
-            rate_limit_dict = get_rate_limit_details()
-            get_rate_limit_wait_time_and_wait(rate_limit_dict)
+            # sleep the program until the reset time has elapsed; the check uses
+            # the budget recorded from the headers of the first response and thus
+            # only contacts the rate limit endpoint when the budget is getting low
+            check_local_rate_state()
             # extract the index of the last page in order to support progress bar creation
-            last_page_index = extract_last_page(response.links)  # type: ignore
-            # continue to extract data from the pages as long as the "next" field is evident
+            last_page_index = extract_last_page(response_links)
+            # continue to extract data from the pages until the last page is reached
             download_pages_task = progress.add_task(
-                "Complete Download", total=last_page_index - 1
+                "Complete Download", total=max(last_page_index - 1, 0)
             )
-            # there is another page and thus WorkKnow should iterate and download it
-            while constants.github.Next in response.links.keys():  # type: ignore
-                # update the "page" variable in the URL to go to the next page
-                # otherwise, make sure to use all of the same parameters as the first request
-                github_params[constants.github.Page] = str(page)
-                # request all of the remaining pages, using the cautious approach
-                (
-                    valid,
-                    complete_retry_count,
-                    complete_sleep_time,
-                    response,
-                ) = request_json_from_github_with_caution(
-                    github_api_url, github_params, github_authentication, progress
-                )
-                logger.debug(response.headers)  # type: ignore
-                # the response from the GitHub API was valid, which means that it either returned
-                # correctly the first time or, alternatively, waiting in an exponential back-off
-                # fashion ultimately resulted in the download completing with success
-                if valid:
-                    # again extract the specific workflow runs list and append it to running response details
-                    json_responses.append(get_workflow_runs(response.json(), console))  # type: ignore
-                    # go to the next page in the pagination results list
-                    page = page + 1
-                    # check if the program is about to exceed GitHub's rate limit and then
-                    # sleep the program until the reset time has elapsed
-                    rate_limit_dict = get_rate_limit_details()
-                    get_rate_limit_wait_time_and_wait(rate_limit_dict)
-                    progress.update(download_pages_task, advance=1)
+            # there is at least one more page and thus WorkKnow should download it;
+            # since the links in the first response reveal the index of the last
+            # page, the URL of every remaining page is known up front and thus the
+            # pages can download concurrently on a small pool of worker threads.
+            # This downloading workload is bound by the input and output associated
+            # with the network and thus the worker threads overlap the round-trip
+            # waiting times instead of paying ΣRTT across all of the pages in sequence
+            if last_page_index >= constants.github.Page_Start:
+                with ThreadPoolExecutor(
+                    max_workers=constants.workknow.Download_Worker_Count
+                ) as download_executor:
+                    page_futures = []
+                    # pagination in GitHub Actions is 1-indexed (i.e., the first
+                    # index is 1) and thus the dispatching of the remaining pages
+                    # starts at page 2 and runs through the last page inclusively
+                    for page in range(constants.github.Page_Start, last_page_index + 1):
+                        # update the "page" variable in the URL to go to the next page;
+                        # otherwise, make sure to use all of the same parameters as the
+                        # first request. Every page receives its own copy of the
+                        # parameters because the worker threads run at the same time
+                        page_params = dict(github_params)
+                        page_params[constants.github.Page] = str(page)
+                        # create the cache key for this page of results and then create
+                        # the conditional request headers out of any previously cached
+                        # ETag; the cache is only read and written on the main thread
+                        url_key = (
+                            github_api_url
+                            + "?"
+                            + constants.github.Page
+                            + "="
+                            + str(page)
+                        )
+                        github_headers = create_conditional_request_headers(
+                            cache_file_name, url_key
+                        )
+                        # request this page of results, using the cautious approach
+                        page_futures.append(
+                            (
+                                url_key,
+                                download_executor.submit(
+                                    request_with_caution,
+                                    github_api_url,
+                                    page_params,
+                                    github_authentication,
+                                    progress,
+                                    maximum_retries,
+                                    github_headers,
+                                ),
+                            )
+                        )
+                    # collect the downloaded pages in their original order so that
+                    # the list of JSON responses matches the sequential download
+                    for url_key, page_future in page_futures:
+                        (
+                            page_valid,
+                            page_retry_count,
+                            page_sleep_time,
+                            response,
+                        ) = page_future.result()
+                        # accumulate the retry diagnostics across all of the pages
+                        complete_retry_count = complete_retry_count + page_retry_count
+                        complete_sleep_time = complete_sleep_time + page_sleep_time
+                        # the response from the GitHub API was valid, which means that
+                        # it either returned correctly the first time or, alternatively,
+                        # waiting in an exponential back-off fashion ultimately resulted
+                        # in the download completing with success
+                        if page_valid:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(response.headers)  # type: ignore
+                            # again extract the workflow runs list, either fresh or
+                            # cached, and append the runs to the list of responses;
+                            # a page without workflow runs data marks the collected
+                            # data as invalid without abandoning the other pages
+                            try:
+                                workflow_runs, _ = get_workflow_runs_with_cache(
+                                    response, cache_file_name, url_key
+                                )
+                            except GitHubNoDataError:
+                                display_no_workflow_data_diagnostic(console)
+                                valid = False
+                            else:
+                                json_responses.extend(workflow_runs)
+                                progress.update(download_pages_task, advance=1)
+                        # at least one of the pages could not be downloaded and thus
+                        # the overall collection of data is not valid and complete
+                        else:
+                            valid = False
     # return the list of workflow runs dictionaries
     return (
         valid,